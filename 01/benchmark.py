@@ -0,0 +1,170 @@
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from generator import search_in_file
+from predict import predict_message_mood, predict_message_mood_batch
+
+LINE_TEMPLATES = (
+    "строка {} с обычным текстом журнала\n",
+    "строка {} содержит фильтр для поиска\n",
+    "строка {} содержит фильтр и стоп слово\n",
+)
+MESSAGES = ("Чапаев и пустота", "Вулкан", "обычное сообщение")
+
+
+def generate_file(path, size_bytes):
+    lines = 0
+    written = 0
+    with open(path, mode='w', encoding='utf-8') as file:
+        while written < size_bytes:
+            block = ''.join(
+                LINE_TEMPLATES[(lines + i) % len(LINE_TEMPLATES)].format(lines + i) for i in range(10000)
+            )
+            file.write(block)
+            written += len(block.encode('utf-8'))
+            lines += 10000
+    return lines
+
+
+def generate_lines_file(path, lines, words, seed):
+    rnd = random.Random(seed)
+    with open(path, mode='w', encoding='utf-8') as file:
+        for i in range(lines):
+            tokens = [f"слово{rnd.randrange(words * 2)}" for _ in range(8)]
+            file.write(f"строка {i} {' '.join(tokens)}\n")
+
+
+def measure(path, lines, trace=None):
+    start = time.perf_counter()
+    matches = sum(1 for _ in search_in_file(path, ["фильтр"], ["стоп"], trace=trace))
+    elapsed = time.perf_counter() - start
+    return matches, elapsed, lines / elapsed
+
+
+def best_of(repeat, func, *args, **kwargs):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        timings.append(time.perf_counter() - start)
+    return result, min(timings)
+
+
+def count_matches(path, search_words, stop_words, use_mmap=False):
+    return sum(1 for _ in search_in_file(path, search_words, stop_words, use_mmap=use_mmap))
+
+
+def predict_one_by_one(messages):
+    return [predict_message_mood(message) for message in messages]
+
+
+def bench_tracing(size_mb):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'bench.txt')
+        lines = generate_file(path, size_mb * 1024 * 1024)
+        print(f"Сгенерирован файл {size_mb} MB, строк: {lines}")
+
+        matches, elapsed, rate = measure(path, lines)
+        print(f"Без трассировки: {elapsed:.2f}s, {rate:,.0f} строк/с, совпадений: {matches}")
+
+        with open(os.devnull, mode='w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+            matches, elapsed, rate = measure(path, lines, trace=print)
+        print(f"С трассировкой (print): {elapsed:.2f}s, {rate:,.0f} строк/с, совпадений: {matches}")
+
+
+def bench_search(line_counts, word_counts, repeat, seed):
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for lines in line_counts:
+            for words in word_counts:
+                path = os.path.join(tmp_dir, f'bench_{lines}_{words}.txt')
+                generate_lines_file(path, lines, words, seed)
+                search_words = [f"слово{i}" for i in range(0, words * 2, 2)]
+                stop_words = [f"слово{i}" for i in range(1, words * 2, 40)]
+                for use_mmap in (False, True):
+                    matches, elapsed = best_of(
+                        repeat, count_matches, path, search_words, stop_words, use_mmap=use_mmap
+                    )
+                    results.append({
+                        "benchmark": "search_in_file",
+                        "mode": "mmap" if use_mmap else "text",
+                        "lines": lines,
+                        "words": words,
+                        "matches": matches,
+                        "seconds": elapsed,
+                        "lines_per_second": lines / elapsed,
+                    })
+                    print(f"search_in_file[{results[-1]['mode']}] lines={lines} words={words}: "
+                          f"{results[-1]['lines_per_second']:,.0f} строк/с")
+    return results
+
+
+def bench_predict(message_counts, repeat, seed):
+    results = []
+    rnd = random.Random(seed)
+    for count in message_counts:
+        messages = [rnd.choice(MESSAGES) for _ in range(count)]
+        for mode, func in (("single", predict_one_by_one), ("batch", predict_message_mood_batch)):
+            _, elapsed = best_of(repeat, func, messages)
+            results.append({
+                "benchmark": "predict_message_mood",
+                "mode": mode,
+                "messages": count,
+                "seconds": elapsed,
+                "messages_per_second": count / elapsed,
+            })
+            print(f"predict_message_mood[{mode}] messages={count}: "
+                  f"{results[-1]['messages_per_second']:,.0f} сообщений/с")
+    return results
+
+
+def run_suite(line_counts, word_counts, message_counts, repeat, seed, output):
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "seed": seed,
+        "results": (
+            bench_search(line_counts, word_counts, repeat, seed)
+            + bench_predict(message_counts, repeat, seed)
+        ),
+    }
+    with open(output, mode='w', encoding='utf-8') as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    print(f"Результаты сохранены в {output}")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks for search_in_file and predict_message_mood")
+    parser.add_argument("--size-mb", type=int, default=1024,
+                        help="Size of the generated file in MB (tracing benchmark, the default command)")
+    subparsers = parser.add_subparsers(dest="command")
+
+    tracing_parser = subparsers.add_parser("tracing", help="Lines/sec with and without tracing")
+    tracing_parser.add_argument("--size-mb", type=int, default=argparse.SUPPRESS,
+                                help="Size of the generated file in MB")
+
+    suite_parser = subparsers.add_parser("suite", help="Throughput across input and word-list sizes")
+    suite_parser.add_argument("--lines", type=int, nargs='+', default=[10_000, 100_000], help="File sizes in lines")
+    suite_parser.add_argument("--words", type=int, nargs='+', default=[10, 1000], help="Search word-list sizes")
+    suite_parser.add_argument("--messages", type=int, nargs='+', default=[10_000, 100_000],
+                              help="Numbers of messages to score")
+    suite_parser.add_argument("--repeat", type=int, default=3, help="Runs per case, the best one is kept")
+    suite_parser.add_argument("--seed", type=int, default=0, help="Random seed for generated inputs")
+    suite_parser.add_argument("--output", default="benchmark_results.json", help="JSON file for the results")
+    args = parser.parse_args()
+
+    if args.command == "suite":
+        run_suite(args.lines, args.words, args.messages, args.repeat, args.seed, args.output)
+    else:
+        bench_tracing(args.size_mb)
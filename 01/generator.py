@@ -1,24 +1,323 @@
-def check_line(line, search_words, stop_words):
+import asyncio
+import glob
+import mmap
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+CHUNK_SIZE = 1 << 22
+READ_SIZE = 1 << 16
+
+
+def _trie_pattern(words):
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if '' in node:
+            return f"(?:{'|'.join(branches)})?"
+        if len(branches) == 1:
+            return branches[0]
+        return f"(?:{'|'.join(branches)})"
+
+    return build(trie)
+
+
+class WordMatcher:
+    __slots__ = ('search_words', 'stop_words', '_pattern', '_shift')
+
+    def __init__(self, search_words, stop_words):
+        self.search_words = frozenset(word.lower() for word in search_words)
+        self.stop_words = frozenset(word.lower() for word in stop_words)
+        self._pattern = None
+        self._shift = 0
+
+    @property
+    def pattern(self):
+        if self._pattern is None:
+            words = [word for word in self.search_words if word]
+            if words:
+                # Общий первый символ даёт регулярке быстрый поиск по литералу,
+                # иначе якоримся на предшествующем пробельном символе.
+                self._shift = int(len({word[0] for word in words}) > 1)
+                prefix = r'\s' if self._shift else ''
+                self._pattern = re.compile(rf'{prefix}{_trie_pattern(words)}(?!\S)')
+        return self._pattern
+
+    def match(self, line):
+        return _match_tokens(line, self.search_words, self.stop_words)
+
+    def check(self, line, trace=None):
+        return check_line(line, self.search_words, self.stop_words, trace)
+
+    def scan_text(self, text):
+        pattern = self.pattern
+        if pattern is None:
+            return
+        if '\r' in text:
+            # Как в текстовом режиме (universal newlines): \r и \r\n тоже завершают строку.
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            for line in text.split('\n'):
+                line = line.strip()
+                if line and self.match(line):
+                    yield line
+            return
+        shift = self._shift
+        if shift:
+            lowered = '\n' + lowered
+        pos = 0
+        while True:
+            found = pattern.search(lowered, pos)
+            if found is None:
+                return
+            start = found.start()
+            if not shift and start > 0 and not text[start - 1].isspace():
+                pos = start + 1
+                continue
+            line_start = text.rfind('\n', 0, start) + 1
+            line_end = text.find('\n', found.end() - shift)
+            if line_end == -1:
+                line_end = len(text)
+            pos = line_end + shift
+            line = text[line_start:line_end].strip()
+            if self.match(line):
+                yield line
+
+
+def _match_tokens(line, search_words, stop_words):
+    tokens = {token.lower() for token in line.split()}
+    return tokens.isdisjoint(stop_words) and not tokens.isdisjoint(search_words)
+
+
+def check_line(line, search_words, stop_words, trace=None):
     if not line:
         return
     line = line.strip()
-    print(line)
-    if any(map(lambda x: x in stop_words, [v.lower() for v in line.split()])):
-        return
-    if any(map(lambda x: x in search_words, [v.lower() for v in line.split()])):
+    if trace is not None:
+        trace(line)
+    if _match_tokens(line, search_words, stop_words):
         yield line
 
 
-def search_in_file(filename, search_words, stop_words):
-    stop_words = [word.lower() for word in stop_words]
-    search_words = [word.lower() for word in search_words]
+def _scan_buffer(buffer, matcher, start=0, end=None, chunk_size=CHUNK_SIZE):
+    if end is None:
+        end = len(buffer)
+    while start < end:
+        stop = min(start + chunk_size, end)
+        if stop < end:
+            newline = max(buffer.rfind(b'\n', start, stop), buffer.rfind(b'\r', start, stop))
+            if newline == -1:
+                newline = min((pos for pos in (buffer.find(b'\n', stop, end), buffer.find(b'\r', stop, end))
+                               if pos != -1), default=-1)
+            stop = end if newline == -1 else newline + 1
+        yield from matcher.scan_text(buffer[start:stop].decode('utf-8'))
+        start = stop
+
+
+def _search_in_mmap(filename, matcher, chunk_size):
+    with open(filename, mode='rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield from _scan_buffer(buffer, matcher, chunk_size=chunk_size)
+
+
+def search_in_file(
+    filename, search_words, stop_words, matcher=None, use_mmap=False, chunk_size=CHUNK_SIZE, trace=None
+):
+    if matcher is None:
+        matcher = WordMatcher(search_words, stop_words)
+    if use_mmap and not isinstance(filename, str):
+        raise TypeError('Режим mmap поддерживает только путь к файлу')
+    if use_mmap and trace is not None:
+        raise ValueError('Трассировка строк недоступна в режиме mmap')
     try:
-        if isinstance(filename, str):
+        if use_mmap:
+            yield from _search_in_mmap(filename, matcher, chunk_size)
+        elif isinstance(filename, str):
             with open(filename, mode='r', encoding='utf-8') as file:
                 for line in file:
-                    yield from check_line(line, search_words, stop_words)
+                    yield from matcher.check(line, trace)
         else:
             for line in filename:
-                yield from check_line(line, search_words, stop_words)
+                yield from matcher.check(line, trace)
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f'Файл не найден: {filename}') from exc
+
+
+def _split_ranges(buffer, parts):
+    size = len(buffer)
+    bounds = [0]
+    for part in range(1, parts):
+        newline = buffer.find(b'\n', max(size * part // parts - 1, bounds[-1]))
+        if newline == -1:
+            break
+        bounds.append(newline + 1)
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def _search_range(filename, matcher, start, end, chunk_size):
+    with open(filename, mode='rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return list(_scan_buffer(buffer, matcher, start, end, chunk_size))
+
+
+def search_in_file_parallel(filename, search_words, stop_words, workers=None, matcher=None, chunk_size=CHUNK_SIZE):
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError('Количество процессов должно быть больше 0')
+    if matcher is None:
+        matcher = WordMatcher(search_words, stop_words)
+    try:
+        with open(filename, mode='rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                ranges = _split_ranges(buffer, workers)
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f'Файл не найден: {filename}') from exc
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_search_range, filename, matcher, start, end, chunk_size)
+            for start, end in ranges
+        ]
+        for future in futures:
+            yield from future.result()
+
+
+def _expand_paths(paths):
+    if isinstance(paths, str):
+        paths = [paths]
+    for path in paths:
+        if glob.has_magic(path):
+            yield from ((match, True) for match in sorted(glob.glob(path, recursive=True)))
+        else:
+            yield path, False
+
+
+def _match_lines(file, matcher, path, line_no, size_hint):
+    lines = file.readlines(size_hint)
+    matches = [
+        (path, number, match)
+        for number, line in enumerate(lines, start=line_no + 1)
+        for match in matcher.check(line)
+    ]
+    return matches, len(lines)
+
+
+async def _search_file(path, matcher, queue, missing_ok):
+    try:
+        file = await asyncio.to_thread(open, path, mode='r', encoding='utf-8')
+    except FileNotFoundError as exc:
+        # Файл из glob мог быть удалён ротацией после раскрытия шаблона.
+        if missing_ok:
+            return
+        raise FileNotFoundError(f'Файл не найден: {path}') from exc
+    try:
+        line_no = 0
+        while True:
+            matches, count = await asyncio.to_thread(_match_lines, file, matcher, path, line_no, READ_SIZE)
+            if not count:
+                return
+            line_no += count
+            for match in matches:
+                await queue.put(match)
+    finally:
+        file.close()
+
+
+async def search_in_files(paths, search_words, stop_words, concurrency=8, matcher=None, max_pending=1024):
+    if concurrency <= 0:
+        raise ValueError('Количество читателей должно быть больше 0')
+    if max_pending <= 0:
+        raise ValueError('Размер очереди должен быть больше 0')
+    if matcher is None:
+        matcher = WordMatcher(search_words, stop_words)
+    queue = asyncio.Queue(maxsize=max_pending)
+    pending_paths = _expand_paths(paths)
+    done = object()
+
+    async def reader():
+        for path, missing_ok in pending_paths:
+            await _search_file(path, matcher, queue, missing_ok)
+
+    async def produce():
+        try:
+            await asyncio.gather(*readers)
+        finally:
+            await queue.put(done)
+
+    readers = [asyncio.create_task(reader()) for _ in range(concurrency)]
+    producer = asyncio.create_task(produce())
+    try:
+        while (match := await queue.get()) is not done:
+            yield match
+        await producer
+    finally:
+        for task in readers + [producer]:
+            task.cancel()
+
+
+def _load_offset(checkpoint):
+    if checkpoint is None:
+        return 0
+    try:
+        with open(checkpoint, mode='r', encoding='utf-8') as file:
+            return int(file.read().strip() or 0)
+    except FileNotFoundError:
+        return 0
+
+
+def _save_offset(checkpoint, offset):
+    if checkpoint is None:
+        return
+    tmp_path = f'{checkpoint}.tmp'
+    with open(tmp_path, mode='w', encoding='utf-8') as file:
+        file.write(str(offset))
+    os.replace(tmp_path, checkpoint)
+
+
+def follow_file(
+    filename, search_words, stop_words, checkpoint=None, poll_interval=1.0, idle_timeout=None, matcher=None
+):
+    if matcher is None:
+        matcher = WordMatcher(search_words, stop_words)
+    offset = saved = _load_offset(checkpoint)
+    idle = 0.0
+    try:
+        with open(filename, mode='rb') as file:
+            while True:
+                if os.fstat(file.fileno()).st_size < offset:
+                    offset = 0
+                file.seek(offset)
+                for line in iter(file.readline, b''):
+                    if not line.endswith(b'\n'):
+                        break
+                    yield from matcher.check(line.decode('utf-8'))
+                    offset += len(line)
+                    idle = 0.0
+                if offset != saved:
+                    _save_offset(checkpoint, offset)
+                    saved = offset
+                if idle_timeout is not None and idle >= idle_timeout:
+                    return
+                time.sleep(poll_interval)
+                idle += poll_interval
     except FileNotFoundError as exc:
         raise FileNotFoundError(f'Файл не найден: {filename}') from exc
+    finally:
+        if offset != saved:
+            _save_offset(checkpoint, offset)
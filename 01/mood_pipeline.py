@@ -0,0 +1,69 @@
+import argparse
+import json
+import sys
+from itertools import islice
+
+from generator import search_in_file
+from predict import CachedModel, SomeModel, predict_message_mood_batch
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def search_sources(sources, search_words, stop_words):
+    for source in sources:
+        if source == '-':
+            yield from ((source, line) for line in search_in_file(sys.stdin, search_words, stop_words))
+        else:
+            yield from ((source, line) for line in search_in_file(source, search_words, stop_words))
+
+
+def score_lines(matches, batch_size=1000, bad_thresholds=0.3, good_thresholds=0.8, model=None):
+    if batch_size <= 0:
+        raise ValueError('Размер пакета должен быть больше 0')
+    if model is None:
+        model = SomeModel()
+    for batch in batched(matches, batch_size):
+        moods = predict_message_mood_batch(
+            [line for _, line in batch], bad_thresholds, good_thresholds, model=model
+        )
+        for (source, line), mood in zip(batch, moods):
+            yield {"source": source, "line": line, "mood": mood}
+
+
+def run_pipeline(sources, search_words, stop_words, output, **kwargs):
+    count = 0
+    for record in score_lines(search_sources(sources, search_words, stop_words), **kwargs):
+        output.write(json.dumps(record, ensure_ascii=False) + '\n')
+        count += 1
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Search lines in files and score their mood as JSON Lines")
+    parser.add_argument("sources", nargs='*', default=['-'], help="Input files, '-' for stdin")
+    parser.add_argument("-s", "--search", action='append', required=True,
+                        help="Word to search for, repeat the option for several words")
+    parser.add_argument("-x", "--stop", action='append', default=[],
+                        help="Stop word, repeat the option for several words")
+    parser.add_argument("-b", "--batch-size", type=int, default=1000, help="Lines scored per batch")
+    parser.add_argument("--bad-threshold", type=float, default=0.3, help="Score below which mood is 'неуд'")
+    parser.add_argument("--good-threshold", type=float, default=0.8, help="Score above which mood is 'отл'")
+    parser.add_argument("--cache-size", type=int, default=0, help="LRU prediction cache size, 0 disables it")
+    args = parser.parse_args(argv)
+
+    model = CachedModel(limit=args.cache_size) if args.cache_size > 0 else SomeModel()
+    return run_pipeline(
+        args.sources, args.search, args.stop, sys.stdout,
+        batch_size=args.batch_size,
+        bad_thresholds=args.bad_threshold,
+        good_thresholds=args.good_threshold,
+        model=model,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,18 @@
+import importlib.util
+from pathlib import Path
+
+MOODS = ('неуд', 'норм', 'отл')
+
+
+def _load_lru_cache():
+    path = Path(__file__).resolve().parent.parent / '05' / 'lru_cache.py'
+    spec = importlib.util.spec_from_file_location('lru_cache', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.LRUCache
+
+
+LRUCache = _load_lru_cache()
 
 
 class SomeModel:
@@ -8,16 +23,78 @@ class SomeModel:
             return 0.2
         return 0.5
 
+    def predict_many(self, messages: list[str]) -> list[float]:
+        return [self.predict(message) for message in messages]
+
+
+class CachedModel:
+    def __init__(self, model: SomeModel | None = None, limit: int = 1024):
+        self.model = model if model is not None else SomeModel()
+        self.cache = LRUCache(limit)
+        self.hits = 0
+        self.misses = 0
+
+    def predict(self, message: str) -> float:
+        value = self.cache.get(message)
+        if value is not None:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = self.model.predict(message)
+        self.cache.set(message, value)
+        return value
+
+    def predict_many(self, messages: list[str]) -> list[float]:
+        values = []
+        missing = {}
+        for index, message in enumerate(messages):
+            value = self.cache.get(message)
+            if value is None:
+                missing.setdefault(message, []).append(index)
+            else:
+                self.hits += 1
+            values.append(value)
+        if missing:
+            self.misses += len(missing)
+            self.hits += sum(len(indexes) - 1 for indexes in missing.values())
+            for message, value in zip(missing, self.model.predict_many(list(missing))):
+                self.cache.set(message, value)
+                for index in missing[message]:
+                    values[index] = value
+        return values
+
 
 def predict_message_mood(
     message: str,
     bad_thresholds: float = 0.3,
     good_thresholds: float = 0.8,
+    model: SomeModel | CachedModel | None = None,
 ) -> str:
-    model = SomeModel()
+    if model is None:
+        model = SomeModel()
     value = model.predict(message)
     if value < bad_thresholds:
         return 'неуд'
     if value > good_thresholds:
         return 'отл'
     return 'норм'
+
+
+def classify_values(
+    values: list[float],
+    bad_thresholds: float = 0.3,
+    good_thresholds: float = 0.8,
+) -> list[str]:
+    bad, normal, good = MOODS
+    return [bad if value < bad_thresholds else good if value > good_thresholds else normal for value in values]
+
+
+def predict_message_mood_batch(
+    messages: list[str],
+    bad_thresholds: float = 0.3,
+    good_thresholds: float = 0.8,
+    model: SomeModel | CachedModel | None = None,
+) -> list[str]:
+    if model is None:
+        model = SomeModel()
+    return classify_values(model.predict_many(list(messages)), bad_thresholds, good_thresholds)
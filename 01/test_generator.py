@@ -1,5 +1,9 @@
+import asyncio
+
 import pytest
-from generator import check_line, search_in_file
+import generator
+from generator import (WordMatcher, _split_ranges, check_line, follow_file, search_in_file,
+                       search_in_file_parallel, search_in_files)
 
 
 @pytest.mark.parametrize(
@@ -229,3 +233,387 @@ def test_search_in_file_same_search_and_stop(tmp_path):
     p.write_text("фильтр\nстоп\nфильтр и стоп", encoding='utf-8')
     result = list(search_in_file(str(p), ["фильтр"], ["фильтр"]))
     assert not result
+
+
+def test_word_matcher_compiles_lowercase_sets():
+    matcher = WordMatcher(["Фильтр", "фильтр", "ДРУГОЙ"], ["Стоп"])
+    assert matcher.search_words == frozenset({"фильтр", "другой"})
+    assert matcher.stop_words == frozenset({"стоп"})
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("Строка с ФильТр", ["Строка с ФильТр"]),
+        ("Строка с другой", ["Строка с другой"]),
+        ("Строка с фильтр и СТОП", []),
+        ("Просто строка", []),
+        ("", []),
+    ],
+)
+def test_word_matcher_check(line, expected):
+    matcher = WordMatcher(["Фильтр", "другой"], ["Стоп"])
+    assert list(matcher.check(line)) == expected
+
+
+def test_search_in_file_with_prebuilt_matcher(tmp_path):
+    p = tmp_path / "test_file.txt"
+    p.write_text("фильтр 1\nстоп фильтр\nдругой 3", encoding='utf-8')
+    matcher = WordMatcher(["фильтр", "другой"], ["стоп"])
+    result = list(search_in_file(str(p), [], [], matcher=matcher))
+    assert result == ["фильтр 1", "другой 3"]
+
+
+def test_search_in_file_many_words_same_result(tmp_path):
+    p = tmp_path / "test_file.txt"
+    p.write_text("слово5 строка\nслово999 стоп42\nничего", encoding='utf-8')
+    search_words = [f"слово{i}" for i in range(1000)]
+    stop_words = [f"стоп{i}" for i in range(1000)]
+    result = list(search_in_file(str(p), search_words, stop_words))
+    assert result == ["слово5 строка"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 20])
+@pytest.mark.parametrize(
+    "content",
+    [
+        "Строка с фильтр\nСтрока со Стоп\nДругая строка",
+        "фильтр 1\nфильтр 2\nстоп 3\nфильтр 4\n",
+        "  ФиЛЬтр в начале  \n\n\nфильтрчастичный\nчастичныйфильтр\n",
+        "фильтр 日本国\n日本語 стоп\nфильтр 汉字",
+        "Строка\r\nс фильтр\r\nфильтр и стоп\r\n",
+        "фильтр 1\rстоп 2\rok\n",
+        "стоп\rфильтр 1\r\nфильтр стоп\r\rфильтр 2\rконец",
+        "İ фильтр\nстрока с фильтр\nстоп фильтр",
+        "фильтр " * 1000 + "\nконец фильтр",
+        "",
+    ],
+)
+def test_search_in_file_mmap_same_as_text_mode(tmp_path, content, chunk_size):
+    p = tmp_path / "test_file.txt"
+    p.write_bytes(content.encode('utf-8'))
+    expected = list(search_in_file(str(p), ["фильтр", "Частичныйфильтр"], ["стоп"]))
+    result = list(search_in_file(str(p), ["фильтр", "Частичныйфильтр"], ["стоп"],
+                                 use_mmap=True, chunk_size=chunk_size))
+    assert result == expected
+
+
+def test_search_in_file_mmap_large_file(tmp_path):
+    p = tmp_path / "test_file.txt"
+    with open(str(p), 'w', encoding='utf-8') as f:
+        for i in range(10000):
+            f.write(f"строка {i} фильтр\n" if i % 100 == 0 else f"строка {i}\n")
+    result = list(search_in_file(str(p), ["фильтр"], ["стоп"], use_mmap=True, chunk_size=4096))
+    assert result == [f"строка {i} фильтр" for i in range(0, 10000, 100)]
+
+
+def test_search_in_file_mmap_not_found():
+    with pytest.raises(FileNotFoundError):
+        list(search_in_file("nonexistent_file.txt", ["фильтр"], ["стоп"], use_mmap=True))
+
+
+def test_search_in_file_mmap_requires_path(tmp_path):
+    p = tmp_path / "test_file.txt"
+    p.write_text("фильтр", encoding='utf-8')
+    with open(str(p), mode='r', encoding='utf-8') as file:
+        with pytest.raises(TypeError):
+            list(search_in_file(file, ["фильтр"], ["стоп"], use_mmap=True))
+
+
+def test_search_in_file_mmap_mixed_encodings(tmp_path):
+    p = tmp_path / "test_file.txt"
+    with open(str(p), 'wb') as f:
+        f.write("фильтр ".encode('utf-8') + "стоп".encode('cp1251') + b"\n")
+    with pytest.raises(UnicodeDecodeError):
+        list(search_in_file(str(p), ["фильтр"], ["стоп"], use_mmap=True))
+
+
+def test_search_in_file_mmap_empty_search_words(tmp_path):
+    p = tmp_path / "test_file.txt"
+    p.write_text("Строка без ничего", encoding='utf-8')
+    assert not list(search_in_file(str(p), [], ["стоп"], use_mmap=True))
+
+
+@pytest.mark.parametrize(
+    "content, parts, expected",
+    [
+        (b"", 4, []),
+        (b"one line", 4, [(0, 8)]),
+        (b"a\nb\nc\nd\n", 2, [(0, 4), (4, 8)]),
+        (b"a\nb\nc\nd\n", 4, [(0, 2), (2, 4), (4, 6), (6, 8)]),
+        (b"aaaaaaaa\nb\n", 4, [(0, 9), (9, 11)]),
+    ],
+)
+def test_split_ranges_aligned_on_lines(content, parts, expected):
+    assert _split_ranges(content, parts) == expected
+
+
+@pytest.mark.parametrize("workers", [1, 3, 8])
+def test_search_in_file_parallel_same_as_sequential(tmp_path, workers):
+    p = tmp_path / "test_file.txt"
+    with open(str(p), 'w', encoding='utf-8') as f:
+        for i in range(5000):
+            if i % 97 == 0:
+                f.write(f"строка {i} Фильтр\n")
+            elif i % 89 == 0:
+                f.write(f"строка {i} фильтр стоп\n")
+            else:
+                f.write(f"строка {i}\n")
+    expected = list(search_in_file(str(p), ["фильтр"], ["стоп"]))
+    result = list(search_in_file_parallel(str(p), ["фильтр"], ["стоп"], workers=workers, chunk_size=1024))
+    assert result == expected
+
+
+def test_search_in_file_parallel_empty_file(tmp_path):
+    p = tmp_path / "test_file.txt"
+    p.write_text("", encoding='utf-8')
+    assert not list(search_in_file_parallel(str(p), ["фильтр"], ["стоп"], workers=2))
+
+
+def test_search_in_file_parallel_not_found():
+    with pytest.raises(FileNotFoundError):
+        list(search_in_file_parallel("nonexistent_file.txt", ["фильтр"], ["стоп"], workers=2))
+
+
+def test_search_in_file_parallel_invalid_workers(tmp_path):
+    p = tmp_path / "test_file.txt"
+    p.write_text("фильтр", encoding='utf-8')
+    with pytest.raises(ValueError):
+        list(search_in_file_parallel(str(p), ["фильтр"], ["стоп"], workers=0))
+
+
+def test_check_line_silent_by_default(capsys):
+    assert list(check_line("Строка с фильтр", ["фильтр"], ["стоп"])) == ["Строка с фильтр"]
+    assert capsys.readouterr().out == ""
+
+
+def test_check_line_trace_called_for_every_line():
+    traced = []
+    assert not list(check_line("  Строка со стоп ", ["фильтр"], ["стоп"], trace=traced.append))
+    assert list(check_line("фильтр", ["фильтр"], ["стоп"], trace=traced.append)) == ["фильтр"]
+    assert not list(check_line("", ["фильтр"], ["стоп"], trace=traced.append))
+    assert traced == ["Строка со стоп", "фильтр"]
+
+
+def test_search_in_file_trace(tmp_path, capsys):
+    p = tmp_path / "test_file.txt"
+    p.write_text("фильтр 1\nстоп 2\nничего 3", encoding='utf-8')
+    result = list(search_in_file(str(p), ["фильтр"], ["стоп"], trace=print))
+    assert result == ["фильтр 1"]
+    assert capsys.readouterr().out.splitlines() == ["фильтр 1", "стоп 2", "ничего 3"]
+
+
+def test_search_in_file_mmap_rejects_trace(tmp_path):
+    p = tmp_path / "test_file.txt"
+    p.write_text("фильтр", encoding='utf-8')
+    with pytest.raises(ValueError):
+        list(search_in_file(str(p), ["фильтр"], ["стоп"], use_mmap=True, trace=print))
+
+
+async def collect(agen):
+    return [item async for item in agen]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrency", [1, 4])
+async def test_search_in_files_many_paths(tmp_path, concurrency):
+    paths = []
+    for i in range(6):
+        p = tmp_path / f"app.log.{i}"
+        p.write_text(f"фильтр {i}\nничего\nстоп фильтр\nФильтр конец {i}", encoding='utf-8')
+        paths.append(str(p))
+    result = await collect(search_in_files(paths, ["фильтр"], ["стоп"], concurrency=concurrency))
+    assert sorted(result) == sorted(
+        match
+        for i, path in enumerate(paths)
+        for match in [(path, 1, f"фильтр {i}"), (path, 4, f"Фильтр конец {i}")]
+    )
+    for path in paths:
+        assert [line_no for p, line_no, _ in result if p == path] == [1, 4]
+
+
+@pytest.mark.asyncio
+async def test_search_in_files_glob(tmp_path):
+    (tmp_path / "a.log").write_text("фильтр a", encoding='utf-8')
+    (tmp_path / "b.log").write_text("фильтр b", encoding='utf-8')
+    (tmp_path / "c.txt").write_text("фильтр c", encoding='utf-8')
+    result = await collect(search_in_files(str(tmp_path / "*.log"), ["фильтр"], ["стоп"]))
+    assert sorted(result) == [
+        (str(tmp_path / "a.log"), 1, "фильтр a"),
+        (str(tmp_path / "b.log"), 1, "фильтр b"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_in_files_no_matching_glob(tmp_path):
+    assert not await collect(search_in_files(str(tmp_path / "*.log"), ["фильтр"], ["стоп"]))
+
+
+@pytest.mark.asyncio
+async def test_search_in_files_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        await collect(search_in_files([str(tmp_path / "missing.log")], ["фильтр"], ["стоп"]))
+
+
+@pytest.mark.asyncio
+async def test_search_in_files_invalid_concurrency(tmp_path):
+    with pytest.raises(ValueError):
+        await collect(search_in_files([], ["фильтр"], ["стоп"], concurrency=0))
+    with pytest.raises(ValueError):
+        await collect(search_in_files([], ["фильтр"], ["стоп"], max_pending=0))
+
+
+class CountingMatcher(WordMatcher):
+    __slots__ = ('checked',)
+
+    def __init__(self, search_words, stop_words):
+        super().__init__(search_words, stop_words)
+        self.checked = 0
+
+    def check(self, line, trace=None):
+        self.checked += 1
+        return super().check(line, trace)
+
+
+@pytest.mark.asyncio
+async def test_search_in_files_bounded_pending(tmp_path):
+    p = tmp_path / "big.log"
+    p.write_text("".join(f"фильтр {i}\n" for i in range(100_000)), encoding='utf-8')
+    matcher = CountingMatcher(["фильтр"], [])
+    matches = search_in_files([str(p)], None, None, matcher=matcher, max_pending=10)
+    assert await anext(matches) == (str(p), 1, "фильтр 0")
+    await asyncio.sleep(0.1)
+    assert matcher.checked < 20_000
+    assert await anext(matches) == (str(p), 2, "фильтр 1")
+    await matches.aclose()
+
+    result = await collect(search_in_files([str(p)], ["фильтр"], [], max_pending=10))
+    assert len(result) == 100_000
+    assert result[-1] == (str(p), 100_000, "фильтр 99999")
+
+
+@pytest.mark.asyncio
+async def test_search_in_files_skips_rotated_glob_matches(tmp_path, monkeypatch):
+    (tmp_path / "app.log").write_text("фильтр 1\n", encoding='utf-8')
+    rotated = str(tmp_path / "app.log.1")
+    monkeypatch.setattr(generator.glob, "glob", lambda pattern, recursive: [rotated, str(tmp_path / "app.log")])
+    result = await collect(search_in_files(str(tmp_path / "app.log*"), ["фильтр"], []))
+    assert result == [(str(tmp_path / "app.log"), 1, "фильтр 1")]
+    with pytest.raises(FileNotFoundError, match="Файл не найден"):
+        await collect(search_in_files([str(tmp_path / "app.log"), rotated], ["фильтр"], []))
+
+
+def test_follow_file_reads_existing_lines_and_saves_offset(tmp_path):
+    p = tmp_path / "app.log"
+    checkpoint = tmp_path / "app.offset"
+    content = "фильтр 1\nстоп фильтр\nФильтр 3\n"
+    p.write_text(content, encoding='utf-8')
+    result = list(follow_file(str(p), ["фильтр"], ["стоп"], checkpoint=str(checkpoint), idle_timeout=0))
+    assert result == ["фильтр 1", "Фильтр 3"]
+    assert checkpoint.read_text(encoding='utf-8') == str(len(content.encode('utf-8')))
+
+
+def test_follow_file_resumes_from_checkpoint(tmp_path):
+    p = tmp_path / "app.log"
+    checkpoint = tmp_path / "app.offset"
+    p.write_text("фильтр 1\n", encoding='utf-8')
+    assert list(follow_file(str(p), ["фильтр"], [], checkpoint=str(checkpoint), idle_timeout=0)) == ["фильтр 1"]
+    with open(str(p), mode='a', encoding='utf-8') as f:
+        f.write("фильтр 2\nфильтр 3\n")
+    result = list(follow_file(str(p), ["фильтр"], [], checkpoint=str(checkpoint), idle_timeout=0))
+    assert result == ["фильтр 2", "фильтр 3"]
+
+
+def test_follow_file_waits_for_complete_line(tmp_path):
+    p = tmp_path / "app.log"
+    checkpoint = tmp_path / "app.offset"
+    p.write_text("фильтр 1\nфильтр неполная", encoding='utf-8')
+    result = list(follow_file(str(p), ["фильтр"], [], checkpoint=str(checkpoint), idle_timeout=0))
+    assert result == ["фильтр 1"]
+    with open(str(p), mode='a', encoding='utf-8') as f:
+        f.write(" строка\n")
+    result = list(follow_file(str(p), ["фильтр"], [], checkpoint=str(checkpoint), idle_timeout=0))
+    assert result == ["фильтр неполная строка"]
+
+
+def test_follow_file_yields_appended_lines(tmp_path):
+    p = tmp_path / "app.log"
+    p.write_text("фильтр 1\n", encoding='utf-8')
+    follower = follow_file(str(p), ["фильтр"], [], poll_interval=0.01, idle_timeout=1)
+    assert next(follower) == "фильтр 1"
+    with open(str(p), mode='a', encoding='utf-8') as f:
+        f.write("ничего\nфильтр 2\n")
+    assert next(follower) == "фильтр 2"
+    follower.close()
+
+
+def test_follow_file_restarts_after_truncation(tmp_path):
+    p = tmp_path / "app.log"
+    checkpoint = tmp_path / "app.offset"
+    p.write_text("фильтр старый журнал\n", encoding='utf-8')
+    list(follow_file(str(p), ["фильтр"], [], checkpoint=str(checkpoint), idle_timeout=0))
+    p.write_text("фильтр\n", encoding='utf-8')
+    result = list(follow_file(str(p), ["фильтр"], [], checkpoint=str(checkpoint), idle_timeout=0))
+    assert result == ["фильтр"]
+
+
+def test_follow_file_saves_offset_on_close(tmp_path):
+    p = tmp_path / "app.log"
+    checkpoint = tmp_path / "app.offset"
+    p.write_text("фильтр 1\nфильтр 2\n", encoding='utf-8')
+    follower = follow_file(str(p), ["фильтр"], [], checkpoint=str(checkpoint), idle_timeout=0)
+    assert next(follower) == "фильтр 1"
+    assert next(follower) == "фильтр 2"
+    follower.close()
+    assert checkpoint.read_text(encoding='utf-8') == str(len("фильтр 1\n".encode('utf-8')))
+
+
+def test_follow_file_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        list(follow_file(str(tmp_path / "missing.log"), ["фильтр"], [], idle_timeout=0))
+
+
+@pytest.mark.parametrize(
+    "search_words",
+    [["фильтр"], ["фильтр", "флаг"], ["фильтр", "другой"]],
+)
+def test_search_in_file_mmap_token_boundaries(tmp_path, search_words):
+    p = tmp_path / "test_file.txt"
+    content = "афильтр\nфильтра\nафильтр фильтр\nфильтр\tконец\nФИЛЬТР\n\tфильтр\nзафильтр фильтрб\n"
+    p.write_text(content, encoding='utf-8')
+    expected = list(search_in_file(str(p), search_words, ["стоп"]))
+    assert expected == ["афильтр фильтр", "фильтр\tконец", "ФИЛЬТР", "фильтр"]
+    assert list(search_in_file(str(p), search_words, ["стоп"], use_mmap=True, chunk_size=5)) == expected
+    assert list(search_in_file(str(p), search_words, ["стоп"], use_mmap=True)) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 8, 1 << 20])
+@pytest.mark.parametrize(
+    "search_words, anchored",
+    [(["фильтр"], False), (["фильтр", "флаг"], False), (["фильтр", "другой"], True), (["флаг", "другой"], True)],
+)
+def test_search_in_file_mmap_matcher_branches(tmp_path, search_words, anchored, chunk_size):
+    assert WordMatcher(search_words, []).pattern.pattern.startswith(r'\s') is anchored
+    content = (
+        "фильтр в начале текста\n"
+        "xфильтр фильтр\n"
+        "xфильтр\n"
+        "флаг в начале строки\n"
+        "другой в начале строки\n"
+        "xдругой xфлаг\n"
+        "\tфлаг после табуляции\n"
+        "конец другой"
+    )
+    p = tmp_path / "test_file.txt"
+    p.write_text(content, encoding='utf-8')
+    expected = list(search_in_file(str(p), search_words, ["стоп"]))
+    assert expected
+    assert list(search_in_file(str(p), search_words, ["стоп"], use_mmap=True, chunk_size=chunk_size)) == expected
+
+
+def test_search_in_file_mmap_cr_line_endings(tmp_path):
+    p = tmp_path / "test_file.txt"
+    p.write_bytes("фильтр 1\rстоп 2\rok\n".encode('utf-8'))
+    assert list(search_in_file(str(p), ["фильтр"], ["стоп"])) == ["фильтр 1"]
+    for chunk_size in (1, 5, 1 << 20):
+        assert list(search_in_file(str(p), ["фильтр"], ["стоп"], use_mmap=True, chunk_size=chunk_size)) == ["фильтр 1"]
@@ -0,0 +1,81 @@
+# pylint: disable=E1101
+import io
+import json
+
+import pytest
+from mood_pipeline import batched, main, run_pipeline, score_lines
+from predict import SomeModel
+
+
+@pytest.mark.parametrize(
+    "items, size, expected",
+    [
+        ([], 3, []),
+        ([1, 2], 3, [[1, 2]]),
+        ([1, 2, 3, 4, 5], 2, [[1, 2], [3, 4], [5]]),
+        (range(4), 2, [[0, 1], [2, 3]]),
+    ],
+)
+def test_batched(items, size, expected):
+    assert list(batched(items, size)) == expected
+
+
+def test_score_lines_batches(mocker):
+    mocker.patch.object(SomeModel, 'predict_many', side_effect=lambda messages: [0.9] * len(messages))
+    matches = (("f.txt", f"line {i}") for i in range(5))
+    result = list(score_lines(matches, batch_size=2))
+    assert [record["line"] for record in result] == [f"line {i}" for i in range(5)]
+    assert all(record["mood"] == "отл" and record["source"] == "f.txt" for record in result)
+    assert SomeModel.predict_many.call_count == 3
+
+
+def test_score_lines_is_lazy(mocker):
+    mocker.patch.object(SomeModel, 'predict_many', side_effect=lambda messages: [0.5] * len(messages))
+
+    def infinite():
+        i = 0
+        while True:
+            yield "-", f"line {i}"
+            i += 1
+
+    scored = score_lines(infinite(), batch_size=10)
+    assert next(scored) == {"source": "-", "line": "line 0", "mood": "норм"}
+    assert SomeModel.predict_many.call_count == 1
+
+
+def test_score_lines_invalid_batch_size():
+    with pytest.raises(ValueError):
+        list(score_lines([], batch_size=0))
+
+
+def test_run_pipeline_files(tmp_path):
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    first.write_text("Чапаев и пустота\nВулкан стоп\nничего", encoding='utf-8')
+    second.write_text("Вулкан\nдругой Чапаев", encoding='utf-8')
+    output = io.StringIO()
+    count = run_pipeline([str(first), str(second)], ["чапаев", "вулкан"], ["стоп"], output, batch_size=2)
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert count == 3
+    assert records == [
+        {"source": str(first), "line": "Чапаев и пустота", "mood": "отл"},
+        {"source": str(second), "line": "Вулкан", "mood": "неуд"},
+        {"source": str(second), "line": "другой Чапаев", "mood": "норм"},
+    ]
+
+
+def test_main_reads_stdin(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO("Вулкан\nпустая строка\n"))
+    assert main(["-s", "вулкан", "--cache-size", "10"]) == 1
+    output = capsys.readouterr().out
+    assert json.loads(output) == {"source": "-", "line": "Вулкан", "mood": "неуд"}
+
+
+def test_main_reads_files_after_options(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "log.txt"
+    path.write_text("Вулкан\nЧапаев и пустота\nЧапаев стоп\n", encoding='utf-8')
+    monkeypatch.setattr("sys.stdin", io.StringIO("Вулкан из stdin\n"))
+    assert main(["-s", "вулкан", "-s", "чапаев", "-x", "стоп", str(path)]) == 2
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record["line"] for record in records] == ["Вулкан", "Чапаев и пустота"]
+    assert all(record["source"] == str(path) for record in records)
@@ -1,6 +1,6 @@
 # pylint: disable=E1101
 import pytest
-from predict import SomeModel, predict_message_mood
+from predict import CachedModel, SomeModel, classify_values, predict_message_mood, predict_message_mood_batch
 
 
 @pytest.mark.parametrize(
@@ -40,3 +40,89 @@ def test_predict_message_mood(mocker, message, return_value, expected_result):
         result = predict_message_mood(message)
     assert result == expected_result
     SomeModel.predict.assert_called_once_with(message)
+
+
+@pytest.mark.parametrize(
+    "values, bad_thresholds, good_thresholds, expected",
+    [
+        ([0.9, 0.2, 0.5], 0.3, 0.8, ["отл", "неуд", "норм"]),
+        ([0.299, 0.3, 0.301, 0.799, 0.8, 0.801], 0.3, 0.8, ["неуд", "норм", "норм", "норм", "норм", "отл"]),
+        ([0.4, 0.5, 0.6, 0.7, 0.799], 0.5, 0.7, ["неуд", "норм", "норм", "норм", "отл"]),
+        ([], 0.3, 0.8, []),
+    ],
+)
+def test_classify_values(values, bad_thresholds, good_thresholds, expected):
+    assert classify_values(values, bad_thresholds, good_thresholds) == expected
+
+
+def test_predict_message_mood_batch_matches_single():
+    messages = ["Чапаев и пустота", "Вулкан", "что-то ещё", "Вулкан"]
+    expected = [predict_message_mood(message) for message in messages]
+    assert predict_message_mood_batch(messages) == expected
+    assert predict_message_mood_batch(iter(messages)) == expected
+
+
+def test_predict_message_mood_batch_shares_model(mocker):
+    model = SomeModel()
+    mocker.patch.object(model, 'predict_many', return_value=[0.1, 0.5, 0.9])
+    result = predict_message_mood_batch(["a", "b", "c"], model=model)
+    assert result == ["неуд", "норм", "отл"]
+    model.predict_many.assert_called_once_with(["a", "b", "c"])
+
+
+def test_predict_message_mood_batch_custom_thresholds(mocker):
+    mocker.patch.object(SomeModel, 'predict', side_effect=[0.4, 0.6, 0.75])
+    result = predict_message_mood_batch(["a", "b", "c"], bad_thresholds=0.5, good_thresholds=0.7)
+    assert result == ["неуд", "норм", "отл"]
+    assert SomeModel.predict.call_count == 3
+
+
+def test_some_model_predict_many():
+    assert SomeModel().predict_many(["Чапаев и пустота", "Вулкан", "другое"]) == [0.9, 0.2, 0.5]
+    assert not SomeModel().predict_many([])
+
+
+def test_cached_model_predict_hits_and_misses(mocker):
+    mocker.patch.object(SomeModel, 'predict', side_effect=[0.9, 0.2])
+    model = CachedModel(limit=10)
+    assert model.predict("a") == 0.9
+    assert model.predict("a") == 0.9
+    assert model.predict("b") == 0.2
+    assert model.predict("a") == 0.9
+    assert (model.hits, model.misses) == (2, 2)
+    assert SomeModel.predict.call_count == 2
+
+
+def test_cached_model_is_bounded(mocker):
+    mocker.patch.object(SomeModel, 'predict', return_value=0.5)
+    model = CachedModel(limit=2)
+    for message in ["a", "b", "c", "a"]:
+        model.predict(message)
+    assert (model.hits, model.misses) == (0, 4)
+    assert len(model.cache.cache) == 2
+
+
+def test_cached_model_invalid_limit():
+    with pytest.raises(ValueError):
+        CachedModel(limit=0)
+
+
+def test_cached_model_predict_many(mocker):
+    inner = SomeModel()
+    mocker.patch.object(inner, 'predict_many', side_effect=[[0.1, 0.9], [0.5]])
+    model = CachedModel(inner, limit=10)
+    assert model.predict_many(["a", "b", "a"]) == [0.1, 0.9, 0.1]
+    assert model.predict_many(["b", "c", "a"]) == [0.9, 0.5, 0.1]
+    assert inner.predict_many.call_args_list == [mocker.call(["a", "b"]), mocker.call(["c"])]
+    assert (model.hits, model.misses) == (3, 3)
+
+
+def test_predict_message_mood_with_cached_model(mocker):
+    mocker.patch.object(SomeModel, 'predict', return_value=0.9)
+    model = CachedModel()
+    assert predict_message_mood("message", model=model) == "отл"
+    assert predict_message_mood("message", model=model) == "отл"
+    assert predict_message_mood_batch(["message", "other"], model=model) == ["отл", "отл"]
+    SomeModel.predict.assert_has_calls([mocker.call("message"), mocker.call("other")])
+    assert SomeModel.predict.call_count == 2
+    assert (model.hits, model.misses) == (2, 2)
@@ -0,0 +1,44 @@
+import argparse
+import logging
+import timeit
+
+from decorator import retry_deco
+
+
+def plain(x, y=None):
+    return x
+
+
+decorated = retry_deco()(plain)
+
+
+def bench_overhead(number, payload_size):
+    payload = list(range(payload_size))
+    logger = logging.getLogger('retry_deco')
+    baseline = timeit.timeit(lambda: plain(payload, y=payload), number=number)
+
+    logger.setLevel(logging.WARNING)
+    disabled = timeit.timeit(lambda: decorated(payload, y=payload), number=number)
+
+    handler = logging.NullHandler()
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    try:
+        enabled = timeit.timeit(lambda: decorated(payload, y=payload), number=number)
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(logging.NOTSET)
+
+    for name, elapsed in (("без декоратора", baseline), ("логирование выключено", disabled),
+                          ("логирование INFO", enabled)):
+        print(f"{name}: {elapsed / number * 1e9:,.0f} нс/вызов")
+    print(f"Накладные расходы декоратора без логирования: {(disabled - baseline) / number * 1e9:,.0f} нс/вызов")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-call overhead of retry_deco")
+    parser.add_argument("--number", type=int, default=100_000, help="Calls per measurement")
+    parser.add_argument("--payload-size", type=int, default=1000, help="Length of the list passed as argument")
+    args = parser.parse_args()
+
+    bench_overhead(args.number, args.payload_size)
@@ -0,0 +1,57 @@
+import argparse
+import json
+import random
+import string
+import timeit
+from functools import partial
+
+from process_json import JSON_BACKENDS, TokenMatcher, create_dict_from_str
+
+
+def random_words(rnd, count):
+    return ' '.join(''.join(rnd.choices(string.ascii_lowercase, k=rnd.randint(3, 10))) for _ in range(count))
+
+
+def generate_documents(shape, count, seed):
+    rnd = random.Random(seed)
+    keys, words = {
+        "small": (3, 5),
+        "wide": (50, 5),
+        "long_values": (3, 500),
+    }[shape]
+    return [
+        json.dumps({f"key{k}": random_words(rnd, words) for k in range(keys)})
+        for _ in range(count)
+    ]
+
+
+def parse_all(documents, loads):
+    return [loads(document) for document in documents]
+
+
+def match_all(documents, loads, matcher):
+    return [list(matcher.match(create_dict_from_str(document, loads))) for document in documents]
+
+
+def bench_backends(shapes, count, number, seed):
+    matcher = TokenMatcher(["key0", "key1"], ["abc", "hello", "world"])
+    for shape in shapes:
+        documents = generate_documents(shape, count, seed)
+        size_mb = sum(len(document) for document in documents) / 1024 / 1024
+        print(f"\nФорма документов '{shape}': {count} шт., {size_mb:.2f} MB")
+        for name, loads in JSON_BACKENDS.items():
+            parse_time = timeit.timeit(partial(parse_all, documents, loads), number=number) / number
+            full_time = timeit.timeit(partial(match_all, documents, loads, matcher), number=number) / number
+            print(f"{name:>12}: разбор {count / parse_time:,.0f} док/с ({size_mb / parse_time:.1f} MB/s), "
+                  f"разбор и поиск {count / full_time:,.0f} док/с")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JSON backend throughput for process_json")
+    parser.add_argument("--shapes", nargs='+', default=["small", "wide", "long_values"], help="Document shapes")
+    parser.add_argument("--count", type=int, default=10_000, help="Documents per shape")
+    parser.add_argument("--number", type=int, default=3, help="Repetitions per measurement")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for generated documents")
+    args = parser.parse_args()
+
+    bench_backends(args.shapes, args.count, args.number, args.seed)
@@ -1,43 +1,331 @@
+from collections import Counter
 from functools import wraps
+import asyncio
+import inspect
+import logging
+import random
+import threading
 import time
 
+LOGGER = logging.getLogger('retry_deco')
 
-def retry_deco(retries=3, expected_errors=None):
-    if expected_errors is None:
-        expected_errors = []
+
+class ConstantBackoff:
+    def __init__(self, delay=1):
+        self.delay = delay
+
+    def __call__(self, attempt, previous):
+        return self.delay
+
+
+class ExponentialBackoff:
+    def __init__(self, base=1, factor=2, cap=None):
+        self.base = base
+        self.factor = factor
+        self.cap = cap
+
+    def __call__(self, attempt, previous):
+        delay = self.base * self.factor ** (attempt - 1)
+        return delay if self.cap is None else min(self.cap, delay)
+
+
+class DecorrelatedJitterBackoff:
+    def __init__(self, base=1, cap=60, rng=None):
+        self.base = base
+        self.cap = cap
+        self.rng = rng or random.Random()
+
+    def __call__(self, attempt, previous):
+        return min(self.cap, self.rng.uniform(self.base, max(self.base, previous) * 3))
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+class CircuitBreaker:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=5, reset_timeout=30, clock=time.monotonic):
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold должен быть больше 0")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state()
+
+    def _state(self):
+        if self.opened_at is None:
+            return self.CLOSED
+        if self.clock() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self):
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial:
+                self._trial = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def release(self):
+        with self._lock:
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.failure_threshold:
+                self.opened_at = self.clock()
+            self._trial = False
+
+
+class RetryBudget:
+    def __init__(self, ratio=0.1, max_tokens=10):
+        if ratio < 0 or max_tokens < 0:
+            raise ValueError("ratio и max_tokens не могут быть отрицательными")
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self):
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class RetryStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.calls = 0
+            self.successes = 0
+            self.failures = 0
+            self.attempts = Counter()
+            self.latency = {}
+            self.sleep_time = 0.0
+            self.errors = Counter()
+
+    def record_attempt(self, attempt, latency, error=None):
+        with self._lock:
+            count, total, worst = self.latency.get(attempt, (0, 0.0, 0.0))
+            self.latency[attempt] = (count + 1, total + latency, max(worst, latency))
+            if error is not None:
+                self.errors[type(error).__name__] += 1
+
+    def record_sleep(self, delay):
+        with self._lock:
+            self.sleep_time += delay
+
+    def record_call(self, attempts, succeeded):
+        with self._lock:
+            self.calls += 1
+            if succeeded:
+                self.successes += 1
+            else:
+                self.failures += 1
+            self.attempts[attempts] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "successes": self.successes,
+                "failures": self.failures,
+                "attempts": dict(self.attempts),
+                "latency": {
+                    attempt: {"count": count, "mean": total / count, "max": worst}
+                    for attempt, (count, total, worst) in sorted(self.latency.items())
+                },
+                "sleep_time": self.sleep_time,
+                "errors": dict(self.errors),
+            }
+
+
+class _Retrier:
+    def __init__(self, func, retries, expected_errors, backoff, deadline, circuit_breaker, retry_budget, logger):
+        self.func = func
+        self.retries = retries
+        self.expected_errors = expected_errors
+        self.backoff = backoff
+        self.deadline = deadline
+        self.circuit_breaker = circuit_breaker
+        self.retry_budget = retry_budget
+        self.logger = logger
+        self.stats = RetryStats()
+
+    def start(self):
+        if self.retry_budget is not None:
+            self.retry_budget.deposit()
+        return None if self.deadline is None else time.monotonic() + self.deadline
+
+    def before_attempt(self, attempt, error, args, kwargs):
+        if self.circuit_breaker is None or self.circuit_breaker.allow():
+            return
+        self.stats.record_call(attempt - 1, succeeded=False)
+        self.logger.error("Функция %s (попытка %s/%s) не вызвана: цепь разомкнута. Аргументы: args=%s, kwargs=%s",
+                          self.func.__name__, attempt, self.retries, args, kwargs)
+        raise CircuitOpenError(f"Цепь для функции {self.func.__name__} разомкнута") from error
+
+    def on_success(self, result, attempt, latency, args, kwargs):
+        self.stats.record_attempt(attempt, latency)
+        self.stats.record_call(attempt, succeeded=True)
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_success()
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Функция %s (попытка %s/%s) выполнена успешно. "
+                             "Аргументы: args=%s, kwargs=%s. Результат: %s",
+                             self.func.__name__, attempt, self.retries, args, kwargs, result)
+
+    def on_abort(self):
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release()
+
+    def on_error(self, error, attempt, previous, deadline_at, latency, args, kwargs):
+        self.stats.record_attempt(attempt, latency, error)
+        try:
+            delay = self._next_delay(error, attempt, previous, deadline_at, args, kwargs)
+        except BaseException:
+            self.stats.record_call(attempt, succeeded=False)
+            raise
+        self.stats.record_sleep(delay)
+        return delay
+
+    def _next_delay(self, error, attempt, previous, deadline_at, args, kwargs):
+        name = self.func.__name__
+        logger = self.logger
+        if isinstance(error, self.expected_errors):
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_success()
+            logger.info("Функция %s (попытка %s/%s) выбросила ожидаемое исключение: %s: %s. "
+                        "Аргументы: args=%s, kwargs=%s",
+                        name, attempt, self.retries, type(error).__name__, error, args, kwargs)
+            logger.info("Исключение %s входит в список ожидаемых. Выход из retry.", type(error).__name__)
+            raise error
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_failure()
+        logger.warning("Функция %s (попытка %s/%s) выбросила исключение: %s: %s. Аргументы: args=%s, kwargs=%s",
+                       name, attempt, self.retries, type(error).__name__, error, args, kwargs)
+        if attempt >= self.retries:
+            logger.error("Функция %s не выполнена после %s попыток. Аргументы: args=%s, kwargs=%s",
+                         name, self.retries, args, kwargs)
+            raise error from error
+        if self.circuit_breaker is not None and self.circuit_breaker.state == CircuitBreaker.OPEN:
+            logger.error("Функция %s не выполнена: цепь разомкнута после %s попыток. Аргументы: args=%s, kwargs=%s",
+                         name, attempt, args, kwargs)
+            raise CircuitOpenError(f"Цепь для функции {name} разомкнута") from error
+        delay = self.backoff(attempt, previous)
+        if deadline_at is not None and time.monotonic() + delay > deadline_at:
+            logger.error("Функция %s не выполнена за %g с (%s попыток). Аргументы: args=%s, kwargs=%s",
+                         name, self.deadline, attempt, args, kwargs)
+            raise error from error
+        if self.retry_budget is not None and not self.retry_budget.withdraw():
+            logger.error("Функция %s не выполнена: бюджет повторов исчерпан. Аргументы: args=%s, kwargs=%s",
+                         name, args, kwargs)
+            raise error from error
+        if delay == 1:
+            logger.info("Повторная попытка через 1 секунду...")
+        else:
+            logger.info("Повторная попытка через %g с...", delay)
+        return delay
+
+
+def retry_deco(retries=3, expected_errors=None, backoff=None, deadline=None, circuit_breaker=None,
+               retry_budget=None, logger=None):
+    expected_errors = tuple(expected_errors or ())
+    if backoff is None:
+        backoff = ConstantBackoff()
+    if logger is None:
+        logger = LOGGER
 
     def decorator(func):
+        retrier = _Retrier(
+            func, retries, expected_errors, backoff, deadline, circuit_breaker, retry_budget, logger
+        )
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                deadline_at = retrier.start()
+                attempt = 0
+                delay = 0
+                error = None
+                while True:
+                    attempt += 1
+                    retrier.before_attempt(attempt, error, args, kwargs)
+                    started = time.perf_counter()
+                    try:
+                        result = await func(*args, **kwargs)
+                    except Exception as e:  # pylint: disable=broad-except
+                        error = e
+                        delay = retrier.on_error(
+                            e, attempt, delay, deadline_at, time.perf_counter() - started, args, kwargs
+                        )
+                        await asyncio.sleep(delay)
+                    except BaseException:
+                        retrier.on_abort()
+                        raise
+                    else:
+                        retrier.on_success(result, attempt, time.perf_counter() - started, args, kwargs)
+                        return result
+
+            async_wrapper.stats = retrier.stats
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
+            deadline_at = retrier.start()
             attempt = 0
-            last_exception = None
-            while attempt < retries:
+            delay = 0
+            error = None
+            while True:
                 attempt += 1
+                retrier.before_attempt(attempt, error, args, kwargs)
+                started = time.perf_counter()
                 try:
                     result = func(*args, **kwargs)
-                    print(f"Функция {func.__name__} (попытка {attempt}/{retries}) выполнена успешно. "
-                          f"Аргументы: args={args}, kwargs={kwargs}. Результат: {result}")
-                    return result
                 except Exception as e:  # pylint: disable=broad-except
-                    if any(isinstance(e, err_type) for err_type in expected_errors):
-                        print(f"Функция {func.__name__} (попытка {attempt}/{retries}) выбросила ожидаемое исключение: "
-                              f"{type(e).__name__}: {e}. Аргументы: args={args}, kwargs={kwargs}")
-                        print(f"Исключение {type(e).__name__} входит в список ожидаемых. Выход из retry.")
-                        raise
-                    last_exception = e
-                    print(f"Функция {func.__name__} (попытка {attempt}/{retries}) выбросила исключение: "
-                          f"{type(e).__name__}: {e}. Аргументы: args={args}, kwargs={kwargs}")
-                    if attempt < retries:
-                        print("Повторная попытка через 1 секунду...")
-                        time.sleep(1)
-                    else:
-                        print(f"Функция {func.__name__} не выполнена после {retries} попыток. "
-                              f"Аргументы: args={args}, kwargs={kwargs}")
-                        raise last_exception from last_exception
-
-            print(f"Функция {func.__name__} не выполнена после {retries} попыток. "
-                  f"Аргументы: args={args}, kwargs={kwargs}")
-            raise last_exception from last_exception
+                    error = e
+                    delay = retrier.on_error(
+                        e, attempt, delay, deadline_at, time.perf_counter() - started, args, kwargs
+                    )
+                    time.sleep(delay)
+                except BaseException:
+                    retrier.on_abort()
+                    raise
+                else:
+                    retrier.on_success(result, attempt, time.perf_counter() - started, args, kwargs)
+                    return result
 
+        wrapper.stats = retrier.stats
         return wrapper
     return decorator
@@ -1,4 +1,69 @@
+# pylint: disable=import-error
+import asyncio
+import importlib.machinery
+import importlib.util
+import inspect
 import json
+import os
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_custom_json():
+    try:
+        import custom_json  # pylint: disable=import-outside-toplevel
+        return custom_json
+    except ImportError:
+        pass
+    build_dir = Path(__file__).resolve().parent.parent / '10'
+    for suffix in importlib.machinery.EXTENSION_SUFFIXES:
+        path = build_dir / f'custom_json{suffix}'
+        if path.exists():
+            spec = importlib.util.spec_from_file_location('custom_json', path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return module
+    return None
+
+
+custom_json = _load_custom_json()
+
+
+def _custom_json_loads(json_str):
+    if not isinstance(json_str, str):
+        raise TypeError(f"Ожидалась строка, получен {type(json_str).__name__}")
+    try:
+        return custom_json.loads(json_str)
+    except TypeError as e:
+        raise json.JSONDecodeError(str(e), json_str, 0) from e
+
+
+# custom_json не декодирует escape-последовательности (\uXXXX), поэтому
+# 'auto' выбирает только бэкенды, совместимые с json по результату.
+AUTO_JSON_BACKENDS = ('orjson', 'json')
+JSON_BACKENDS = {'json': json.loads}
+if custom_json is not None:
+    JSON_BACKENDS['custom_json'] = _custom_json_loads
+if orjson is not None:
+    JSON_BACKENDS['orjson'] = orjson.loads  # pylint: disable=no-member
+
+
+def get_json_backend(name=None):
+    if name is None:
+        return json.loads
+    if name == 'auto':
+        name = next(backend for backend in AUTO_JSON_BACKENDS if backend in JSON_BACKENDS)
+    try:
+        return JSON_BACKENDS[name]
+    except KeyError as e:
+        raise ValueError(f"JSON-бэкенд {name} недоступен, доступны: {', '.join(JSON_BACKENDS)}") from e
 
 
 def check_token_in_values(token, values):
@@ -7,9 +72,28 @@ def check_token_in_values(token, values):
     return token_lower in values_lower
 
 
-def create_dict_from_str(json_str):
+class TokenMatcher:
+    def __init__(self, required_keys: list[str] | None = None, tokens: list[str] | None = None):
+        self.required_keys = frozenset(required_keys or ())
+        self.tokens = {}
+        for index, token in enumerate(tokens or ()):
+            self.tokens.setdefault(token.lower(), []).append((index, token))
+
+    def match(self, json_dict: dict[str, list[str]]):
+        for key, value in json_dict.items():
+            if key not in self.required_keys:
+                continue
+            found = self.tokens.keys() & {word.lower() for word in value}
+            for _, token in sorted(pair for lowered in found for pair in self.tokens[lowered]):
+                yield key, token
+
+    def process(self, json_str: str, loads=json.loads):
+        return self.match(create_dict_from_str(json_str, loads))
+
+
+def create_dict_from_str(json_str, loads=json.loads):
     try:
-        data = json.loads(json_str)
+        data = loads(json_str)
         if not isinstance(data, dict):
             raise ValueError("Строка должна представлять JSON-словарь")
         json_dict = {}
@@ -27,28 +111,182 @@ def create_dict_from_str(json_str):
         raise ValueError(str(e)) from e
 
 
+def _parse_document(json_str, required_keys, tokens, matcher, backend):
+    loads = get_json_backend(backend)
+    if matcher is None:
+        matcher = TokenMatcher(required_keys, tokens)
+    try:
+        return list(matcher.match(create_dict_from_str(json_str, loads)))
+    except ValueError as e:
+        print(f"Ошибка: {e}")
+        return None
+
+
 def process_json(
     json_str: str,
     required_keys: list[str] | None = None,
     tokens: list[str] | None = None,
-    callback=None
+    callback=None,
+    matcher: TokenMatcher | None = None,
+    backend: str | None = None,
+    batch_callback=None,
+) -> None:
+    matches = _parse_document(json_str, required_keys, tokens, matcher, backend)
+    if matches is None:
+        return
+
+    if batch_callback:
+        if matches:
+            print(batch_callback(matches))
+        return
+
+    for key, token in matches:
+        if callback:
+            print(callback(key, token))
+        else:
+            print(f"{key}: {token}")
+
+
+async def _call(callback, *args):
+    result = callback(*args)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def process_json_async(
+    json_str: str,
+    required_keys: list[str] | None = None,
+    tokens: list[str] | None = None,
+    callback=None,
+    matcher: TokenMatcher | None = None,
+    backend: str | None = None,
+    batch_callback=None,
 ) -> None:
-    if required_keys is None:
-        required_keys = []
-    if tokens is None:
-        tokens = []
+    matches = _parse_document(json_str, required_keys, tokens, matcher, backend)
+    if matches is None:
+        return
+
+    if batch_callback:
+        if matches:
+            print(await _call(batch_callback, matches))
+        return
+
+    if not callback:
+        for key, token in matches:
+            print(f"{key}: {token}")
+        return
+
+    for result in await asyncio.gather(*(_call(callback, key, token) for key, token in matches)):
+        print(result)
+
+
+async def dispatch_matches(matches, batch_callback, batch_size: int = 100, concurrency: int = 4) -> int:
+    if batch_size <= 0 or concurrency <= 0:
+        raise ValueError("Размер пакета и число одновременных вызовов должны быть больше 0")
+    semaphore = asyncio.Semaphore(concurrency)
 
+    async def send(batch):
+        try:
+            await _call(batch_callback, batch)
+        finally:
+            semaphore.release()
+
+    tasks = []
+    iterator = iter(matches)
     try:
-        json_dict = create_dict_from_str(json_str)
-    except ValueError as e:
-        print(f"Ошибка: {e}")
+        while batch := list(islice(iterator, batch_size)):
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(send(batch)))
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    return len(tasks)
+
+
+def _iter_lines(source):
+    if isinstance(source, str):
+        with open(source, mode='r', encoding='utf-8') as file:
+            yield from file
+    else:
+        yield from source
+
+
+def process_json_stream(
+    source,
+    required_keys: list[str] | None = None,
+    tokens: list[str] | None = None,
+    matcher: TokenMatcher | None = None,
+    counters: Counter | None = None,
+    backend: str | None = None,
+):
+    if matcher is None:
+        matcher = TokenMatcher(required_keys, tokens)
+    if counters is None:
+        counters = Counter()
+    loads = get_json_backend(backend)
+
+    for line in _iter_lines(source):
+        if not line.strip():
+            continue
+        try:
+            json_dict = create_dict_from_str(line, loads)
+        except ValueError:
+            counters['skipped'] += 1
+            continue
+        counters['processed'] += 1
+        for match in matcher.match(json_dict):
+            counters['matches'] += 1
+            yield match
+
+
+def _count_matches(source, required_keys, tokens, backend):
+    counters = Counter()
+    matches = Counter(process_json_stream(source, required_keys, tokens, counters=counters, backend=backend))
+    return matches, counters
+
+
+def _shards(sources, files, chunk_size):
+    if files:
+        yield from sources
         return
+    iterator = iter(sources)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def process_json_parallel(
+    sources,
+    required_keys: list[str] | None = None,
+    tokens: list[str] | None = None,
+    files: bool = False,
+    workers: int | None = None,
+    chunk_size: int = 1000,
+    backend: str | None = None,
+    counters: Counter | None = None,
+) -> Counter:
+    if chunk_size <= 0:
+        raise ValueError("Размер пакета должен быть больше 0")
+    get_json_backend(backend)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    total = Counter()
+
+    def merge(done):
+        for future in done:
+            matches, shard_counters = future.result()
+            total.update(matches)
+            if counters is not None:
+                counters.update(shard_counters)
 
-    for key, value in json_dict.items():
-        if key in required_keys:
-            for token in tokens:
-                if check_token_in_values(token, value):
-                    if callback:
-                        print(callback(key, token))
-                    else:
-                        print(f"{key}: {token}")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for shard in _shards(sources, files, chunk_size):
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                merge(done)
+            pending.add(executor.submit(_count_matches, shard, required_keys, tokens, backend))
+        merge(wait(pending).done)
+    return total
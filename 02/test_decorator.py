@@ -1,23 +1,29 @@
 from io import StringIO
-import sys
-from unittest.mock import patch
+import asyncio
+import inspect
+import logging
+import random
+import threading
+import time
+from unittest.mock import AsyncMock, Mock, patch
 import pytest
-from decorator import retry_deco
+from decorator import (CircuitBreaker, CircuitOpenError, ConstantBackoff, DecorrelatedJitterBackoff, ExponentialBackoff,
+                       RetryBudget, RetryStats, retry_deco)
 
 
 def capture_output(func, *args, **kwargs):
-    old_stdout = sys.stdout
-    sys.stdout = StringIO()
+    stream = StringIO()
+    handler = logging.StreamHandler(stream)
+    logger = logging.getLogger('retry_deco')
+    level = logger.level
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
     try:
         result = func(*args, **kwargs)
-        output = sys.stdout.getvalue()
-        return result, output
-    except Exception as e:
-        output = sys.stdout.getvalue()
-        sys.stdout = old_stdout
-        raise e
+        return result, stream.getvalue()
     finally:
-        sys.stdout = old_stdout
+        logger.removeHandler(handler)
+        logger.setLevel(level)
 
 
 def test_retry_deco_success_after_retry():
@@ -196,3 +202,545 @@ def test_retry_deco_no_retries_on_expected_error():
     result, output = capture_output(func, 2)
     assert result == 4
     assert "Аргументы: args=(2,), kwargs={}" in output
+
+
+@pytest.mark.asyncio
+async def test_retry_deco_async_success_after_retry(caplog):
+    caplog.set_level(logging.INFO, logger='retry_deco')
+    attempts = []
+
+    @retry_deco(retries=3)
+    async def func(x):
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise RuntimeError("Temporary error")
+        return x * 2
+
+    with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        result = await func(1)
+
+    assert result == 2
+    assert len(attempts) == 2
+    mock_sleep.assert_awaited_once_with(1)
+    output = caplog.text
+    assert "Функция func (попытка 2/3) выполнена успешно. Аргументы: args=(1,), kwargs={}. Результат: 2" in output
+
+
+@pytest.mark.asyncio
+async def test_retry_deco_async_does_not_block_event_loop():
+    attempts = []
+    ticks = []
+
+    @retry_deco(retries=2)
+    async def func():
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise RuntimeError("Temporary error")
+        return "done"
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(1)
+            await asyncio.sleep(0.1)
+
+    with patch('time.sleep') as mock_sleep:
+        result, _ = await asyncio.gather(func(), ticker())
+
+    assert result == "done"
+    assert len(ticks) == 5
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_retry_deco_async_expected_error_immediately_raises():
+    attempts = []
+
+    @retry_deco(retries=3, expected_errors=[ValueError])
+    async def func():
+        attempts.append(1)
+        raise ValueError("Expected error")
+
+    with pytest.raises(ValueError, match="Expected error"):
+        await func()
+    assert len(attempts) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_deco_async_all_retries_exhausted(caplog):
+    caplog.set_level(logging.INFO, logger='retry_deco')
+
+    @retry_deco(retries=2)
+    async def func():
+        raise RuntimeError("Permanent error")
+
+    with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        with pytest.raises(RuntimeError, match="Permanent error"):
+            await func()
+
+    mock_sleep.assert_awaited_once_with(1)
+    assert "Функция func не выполнена после 2 попыток. Аргументы: args=(), kwargs={}" in caplog.text
+
+
+def test_retry_deco_async_preserves_coroutine_function():
+    @retry_deco()
+    async def original_func():
+        """Async test function"""
+
+    assert inspect.iscoroutinefunction(original_func)
+    assert original_func.__name__ == "original_func"
+    assert original_func.__doc__ == "Async test function"
+
+
+@pytest.mark.parametrize(
+    "backoff, expected",
+    [
+        (ConstantBackoff(), [1, 1, 1, 1]),
+        (ConstantBackoff(0.5), [0.5, 0.5, 0.5, 0.5]),
+        (ExponentialBackoff(), [1, 2, 4, 8]),
+        (ExponentialBackoff(base=0.1, factor=3), [0.1, 0.3, 0.9, 2.7]),
+        (ExponentialBackoff(base=1, cap=3), [1, 2, 3, 3]),
+    ],
+)
+def test_backoff_delays(backoff, expected):
+    delays = []
+    previous = 0
+    for attempt in range(1, 5):
+        previous = backoff(attempt, previous)
+        delays.append(previous)
+    assert delays == pytest.approx(expected)
+
+
+def test_decorrelated_jitter_backoff_bounds():
+    backoff = DecorrelatedJitterBackoff(base=1, cap=10, rng=random.Random(42))
+    previous = 0
+    delays = []
+    for attempt in range(1, 50):
+        delay = backoff(attempt, previous)
+        assert 1 <= delay <= 10
+        assert delay <= max(1, previous) * 3
+        delays.append(delay)
+        previous = delay
+    assert len(set(delays)) > 1
+
+
+@patch('time.sleep')
+def test_retry_deco_uses_backoff(mock_sleep, caplog):
+    caplog.set_level(logging.INFO, logger='retry_deco')
+
+    @retry_deco(retries=4, backoff=ExponentialBackoff(base=0.5))
+    def func():
+        raise RuntimeError("Error")
+
+    with pytest.raises(RuntimeError):
+        func()
+
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1, 2]
+    output = caplog.text
+    assert "Повторная попытка через 0.5 с..." in output
+    assert "Повторная попытка через 2 с..." in output
+
+
+@patch('time.sleep')
+def test_retry_deco_jitter_passes_previous_delay(mock_sleep):
+    seen = []
+
+    def backoff(attempt, previous):
+        seen.append((attempt, previous))
+        return attempt * 10
+
+    @retry_deco(retries=3, backoff=backoff)
+    def func():
+        raise RuntimeError("Error")
+
+    with pytest.raises(RuntimeError):
+        func()
+    assert seen == [(1, 0), (2, 10)]
+
+
+def test_retry_deco_deadline_stops_retries(caplog):
+    caplog.set_level(logging.INFO, logger='retry_deco')
+    attempts = []
+
+    @retry_deco(retries=10, backoff=ConstantBackoff(0.05), deadline=0.12)
+    def func():
+        attempts.append(1)
+        raise RuntimeError("Error")
+
+    start = time.monotonic()
+    with pytest.raises(RuntimeError, match="Error"):
+        func()
+    assert time.monotonic() - start < 0.5
+    assert 1 < len(attempts) < 10
+    assert f"Функция func не выполнена за 0.12 с ({len(attempts)} попыток)" in caplog.text
+
+
+@patch('time.sleep')
+def test_retry_deco_deadline_rejects_long_sleep(mock_sleep):
+    attempts = []
+
+    @retry_deco(retries=5, backoff=ConstantBackoff(10), deadline=5)
+    def func():
+        attempts.append(1)
+        raise RuntimeError("Error")
+
+    with pytest.raises(RuntimeError):
+        func()
+    assert len(attempts) == 1
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_retry_deco_async_backoff_and_deadline():
+    attempts = []
+
+    @retry_deco(retries=5, backoff=ExponentialBackoff(base=0.01), deadline=0.05)
+    async def func():
+        attempts.append(1)
+        raise RuntimeError("Error")
+
+    with pytest.raises(RuntimeError):
+        await func()
+    assert 1 < len(attempts) < 5
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_circuit_breaker_opens_after_threshold_and_half_opens():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    clock.now = 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.now = 20
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 0
+
+
+def test_circuit_breaker_invalid_threshold():
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_threshold=0)
+
+
+@patch('time.sleep')
+def test_retry_deco_circuit_breaker_fails_fast(mock_sleep, caplog):
+    caplog.set_level(logging.INFO, logger='retry_deco')
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock)
+    calls = []
+
+    @retry_deco(retries=5, circuit_breaker=breaker)
+    def func():
+        calls.append(1)
+        raise RuntimeError("Outage")
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        func()
+    assert isinstance(exc_info.value.__cause__, RuntimeError)
+    assert len(calls) == 3
+
+    with pytest.raises(CircuitOpenError):
+        func()
+    assert len(calls) == 3
+    assert "не вызвана: цепь разомкнута" in caplog.text
+
+    clock.now = 30
+    with pytest.raises(CircuitOpenError):
+        func()
+    assert len(calls) == 4
+
+
+@patch('time.sleep')
+def test_retry_deco_circuit_breaker_closes_on_success(mock_sleep):
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=5, clock=clock)
+    healthy = []
+
+    @retry_deco(retries=2, circuit_breaker=breaker)
+    def func():
+        if not healthy:
+            raise RuntimeError("Outage")
+        return "ok"
+
+    with pytest.raises(RuntimeError):
+        func()
+    assert breaker.state == CircuitBreaker.OPEN
+    healthy.append(1)
+    clock.now = 5
+    assert func() == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_retry_deco_circuit_breaker_ignores_expected_errors():
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    @retry_deco(retries=3, expected_errors=[ValueError], circuit_breaker=breaker)
+    def func():
+        raise ValueError("Business error")
+
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            func()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_circuit_breaker_thread_safe():
+    breaker = CircuitBreaker(failure_threshold=10_000)
+
+    def worker():
+        for _ in range(1000):
+            breaker.record_failure()
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert breaker.failures == 8000
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_retry_budget_tokens():
+    budget = RetryBudget(ratio=0.5, max_tokens=2)
+    assert budget.withdraw()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+    for _ in range(10):
+        budget.deposit()
+    assert budget.tokens == 2
+
+
+def test_retry_budget_invalid():
+    with pytest.raises(ValueError):
+        RetryBudget(ratio=-1)
+
+
+@patch('time.sleep')
+def test_retry_deco_retry_budget_caps_retries(mock_sleep, caplog):
+    caplog.set_level(logging.INFO, logger='retry_deco')
+    budget = RetryBudget(ratio=0.1, max_tokens=2)
+    calls = []
+
+    @retry_deco(retries=3, retry_budget=budget)
+    def func():
+        calls.append(1)
+        raise RuntimeError("Outage")
+
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            func()
+    assert len(calls) == 3 + 1 + 1
+    assert "бюджет повторов исчерпан" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_retry_deco_async_circuit_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    calls = []
+
+    @retry_deco(retries=3, circuit_breaker=breaker)
+    async def func():
+        calls.append(1)
+        raise RuntimeError("Outage")
+
+    with pytest.raises(CircuitOpenError):
+        await func()
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_deco_async_circuit_breaker_cancelled_trial():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now = 10
+    calls = []
+
+    @retry_deco(retries=1, circuit_breaker=breaker)
+    async def func(delay):
+        calls.append(delay)
+        await asyncio.sleep(delay)
+        return delay
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(func(10), timeout=0.01)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert await func(0) == 0
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert calls == [10, 0]
+
+
+def test_retry_deco_circuit_breaker_interrupted_trial():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now = 10
+
+    @retry_deco(retries=1, circuit_breaker=breaker)
+    def func(error):
+        if error is not None:
+            raise error
+        return "ok"
+
+    with pytest.raises(KeyboardInterrupt):
+        func(KeyboardInterrupt())
+    assert func(None) == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_retry_deco_success_path_skips_formatting_when_disabled():
+    logger = Mock(spec=logging.Logger)
+    logger.isEnabledFor.return_value = False
+
+    @retry_deco(logger=logger)
+    def func(x):
+        return x
+
+    assert func(1) == 1
+    logger.isEnabledFor.assert_called_once_with(logging.INFO)
+    logger.info.assert_not_called()
+
+
+def test_retry_deco_custom_logger_lazy_arguments(caplog):
+    logger = logging.getLogger('custom_retry')
+    caplog.set_level(logging.INFO, logger='custom_retry')
+
+    @retry_deco(retries=1, logger=logger)
+    def func(x):
+        return x * 2
+
+    assert func(2) == 4
+    record = caplog.records[-1]
+    assert record.name == 'custom_retry'
+    assert record.args == ('func', 1, 1, (2,), {}, 4)
+    assert record.getMessage() == "Функция func (попытка 1/1) выполнена успешно. Аргументы: args=(2,), kwargs={}. Результат: 4"
+
+
+def test_retry_deco_does_not_print(capsys):
+    @retry_deco(retries=1)
+    def func():
+        return 1
+
+    assert func() == 1
+    assert capsys.readouterr().out == ""
+
+
+@patch('time.sleep')
+def test_retry_deco_stats(mock_sleep):
+    outcomes = iter([KeyError("a"), "ok", KeyError("b"), RuntimeError("c"), "ok", ValueError("d")])
+
+    @retry_deco(retries=3, expected_errors=[ValueError], backoff=ConstantBackoff(0.5))
+    def func():
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert func() == "ok"
+    assert func() == "ok"
+    with pytest.raises(ValueError):
+        func()
+
+    stats = func.stats.snapshot()
+    assert stats["calls"] == 3
+    assert stats["successes"] == 2
+    assert stats["failures"] == 1
+    assert stats["attempts"] == {2: 1, 3: 1, 1: 1}
+    assert stats["sleep_time"] == pytest.approx(1.5)
+    assert stats["errors"] == {"KeyError": 2, "RuntimeError": 1, "ValueError": 1}
+    assert {attempt: data["count"] for attempt, data in stats["latency"].items()} == {1: 3, 2: 2, 3: 1}
+    assert all(data["max"] >= data["mean"] >= 0 for data in stats["latency"].values())
+
+
+@patch('time.sleep')
+def test_retry_deco_stats_exhausted_and_circuit_open(mock_sleep):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+    @retry_deco(retries=2, circuit_breaker=breaker)
+    def func():
+        raise RuntimeError("Outage")
+
+    with pytest.raises(RuntimeError):
+        func()
+    with pytest.raises(CircuitOpenError):
+        func()
+    stats = func.stats.snapshot()
+    assert stats["calls"] == 2
+    assert stats["failures"] == 2
+    assert stats["attempts"] == {2: 1, 0: 1}
+
+
+def test_retry_deco_stats_per_function_and_reset():
+    @retry_deco()
+    def first():
+        return 1
+
+    @retry_deco()
+    def second():
+        return 2
+
+    first()
+    first()
+    second()
+    assert first.stats.snapshot()["calls"] == 2
+    assert second.stats.snapshot()["calls"] == 1
+    first.stats.reset()
+    assert first.stats.snapshot() == RetryStats().snapshot()
+
+
+def test_retry_stats_thread_safe():
+    stats = RetryStats()
+
+    def worker():
+        for _ in range(1000):
+            stats.record_attempt(1, 0.001, KeyError())
+            stats.record_call(1, succeeded=False)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    snapshot = stats.snapshot()
+    assert snapshot["calls"] == 8000
+    assert snapshot["errors"] == {"KeyError": 8000}
+    assert snapshot["latency"][1]["count"] == 8000
+
+
+@pytest.mark.asyncio
+async def test_retry_deco_async_stats():
+    attempts = []
+
+    @retry_deco(retries=3, backoff=ConstantBackoff(0))
+    async def func():
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise RuntimeError("Temporary error")
+        return "ok"
+
+    assert await func() == "ok"
+    stats = func.stats.snapshot()
+    assert stats["attempts"] == {2: 1}
+    assert stats["errors"] == {"RuntimeError": 1}
@@ -1,6 +1,16 @@
-from unittest.mock import Mock
+import asyncio
+import json
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from unittest.mock import AsyncMock, Mock
 import pytest
-from process_json import check_token_in_values, create_dict_from_str, process_json
+import process_json as process_json_module
+from process_json import (AUTO_JSON_BACKENDS, JSON_BACKENDS, TokenMatcher, check_token_in_values, create_dict_from_str, get_json_backend,
+                          dispatch_matches, process_json, process_json_async, process_json_parallel,
+                          process_json_stream)
 
 
 def test_check_token_in_values():
@@ -118,3 +128,320 @@ def test_process_json_empty_required_keys(capsys):
     process_json(json_str, required_keys=[], tokens=["value1"])
     captured = capsys.readouterr()
     assert captured.out == ""
+
+
+@pytest.mark.parametrize(
+    "json_dict, required_keys, tokens, expected",
+    [
+        ({"key1": ["value1", "value2"]}, ["key1"], ["value1"], [("key1", "value1")]),
+        ({"key1": ["VALUE1", "value2"]}, ["key1"], ["Value1"], [("key1", "Value1")]),
+        ({"key1": ["a", "b", "c"]}, ["key1"], ["c", "x", "a"], [("key1", "c"), ("key1", "a")]),
+        ({"key1": ["a"], "key2": ["a"]}, ["key2"], ["a"], [("key2", "a")]),
+        ({"key1": ["a"], "key2": ["b"]}, ["key2", "key1"], ["b", "a"], [("key1", "a"), ("key2", "b")]),
+        ({"key1": ["a"]}, ["key1"], ["a", "A"], [("key1", "a"), ("key1", "A")]),
+        ({"key1": ["a"]}, [], ["a"], []),
+        ({"key1": ["a"]}, ["key1"], [], []),
+        ({}, ["key1"], ["a"], []),
+    ],
+)
+def test_token_matcher_match(json_dict, required_keys, tokens, expected):
+    assert list(TokenMatcher(required_keys, tokens).match(json_dict)) == expected
+
+
+def test_token_matcher_reused_for_many_documents():
+    matcher = TokenMatcher(["key1"], ["value1", "value3"])
+    documents = [
+        '{"key1": "value1 value2"}',
+        '{"key1": "value3 VALUE1"}',
+        '{"key2": "value1"}',
+    ]
+    assert [list(matcher.process(document)) for document in documents] == [
+        [("key1", "value1")],
+        [("key1", "value1"), ("key1", "value3")],
+        [],
+    ]
+
+
+def test_token_matcher_process_invalid_json():
+    with pytest.raises(ValueError, match="Ошибка декодирования JSON"):
+        list(TokenMatcher(["key1"], ["value1"]).process("{invalid}"))
+
+
+def test_process_json_with_prebuilt_matcher(capsys):
+    matcher = TokenMatcher(["key1"], ["value2"])
+    process_json('{"key1": "value1 value2"}', matcher=matcher)
+    process_json('{"key1": "value2"}', matcher=matcher)
+    assert capsys.readouterr().out.splitlines() == ["key1: value2", "key1: value2"]
+
+
+NDJSON = (
+    '{"key1": "value1 value2", "key2": "value3"}\n'
+    '\n'
+    '{invalid}\n'
+    '["not", "a", "dict"]\n'
+    '{"key1": "VALUE3 value1"}\n'
+    '{"key1": 123}\n'
+    '{"key2": "value1"}'
+)
+
+
+def test_process_json_stream_iterable():
+    counters = Counter()
+    result = list(process_json_stream(
+        NDJSON.splitlines(), required_keys=["key1"], tokens=["value1", "value3"], counters=counters
+    ))
+    assert result == [("key1", "value1"), ("key1", "value1"), ("key1", "value3")]
+    assert counters == Counter(processed=3, skipped=3, matches=3)
+
+
+def test_process_json_stream_file_object_and_path(tmp_path):
+    p = tmp_path / "docs.ndjson"
+    p.write_text(NDJSON, encoding='utf-8')
+    expected = [("key1", "value1"), ("key1", "value1")]
+    assert list(process_json_stream(StringIO(NDJSON), ["key1"], ["value1"])) == expected
+    assert list(process_json_stream(str(p), ["key1"], ["value1"])) == expected
+
+
+def test_process_json_stream_is_lazy(capsys):
+    def documents():
+        while True:
+            yield '{"key1": "value1"}'
+
+    stream = process_json_stream(documents(), ["key1"], ["value1"])
+    assert next(stream) == ("key1", "value1")
+    assert next(stream) == ("key1", "value1")
+    assert capsys.readouterr().out == ""
+
+
+def test_process_json_stream_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        list(process_json_stream(str(tmp_path / "missing.ndjson"), ["key1"], ["value1"]))
+
+
+@pytest.mark.parametrize("backend", sorted(JSON_BACKENDS))
+def test_create_dict_from_str_backends(backend):
+    loads = get_json_backend(backend)
+    assert create_dict_from_str('{"key1": "value1 value2", "key2": "value3"}', loads) == {
+        "key1": ["value1", "value2"], "key2": ["value3"]
+    }
+    with pytest.raises(ValueError, match="Ошибка декодирования JSON"):
+        create_dict_from_str("{invalid}", loads)
+    with pytest.raises(ValueError, match="Строка должна представлять JSON-словарь"):
+        create_dict_from_str('["not", "a", "dict"]', loads)
+    with pytest.raises(ValueError, match="Значения в JSON должны быть строками"):
+        create_dict_from_str('{"key": 123}', loads)
+
+
+@pytest.mark.parametrize("backend", sorted(JSON_BACKENDS))
+def test_process_json_backends(capsys, backend):
+    process_json('{"key1": "value1 value2"}', required_keys=["key1"], tokens=["value2"], backend=backend)
+    process_json("{invalid}", required_keys=["key1"], tokens=["value2"], backend=backend)
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "key1: value2"
+    assert lines[1].startswith("Ошибка: Ошибка декодирования JSON")
+    counters = Counter()
+    result = list(process_json_stream(NDJSON.splitlines(), ["key1"], ["value1"], counters=counters, backend=backend))
+    assert result == [("key1", "value1"), ("key1", "value1")]
+    assert counters["skipped"] == 3
+
+
+@pytest.mark.parametrize("backend", sorted(JSON_BACKENDS))
+def test_json_backends_escaped_document(capsys, backend):
+    json_str = '{"key1": "\\u0416\\u0443\\u043a \\"quoted\\" value1", "key2": "\\u0416\\u0443\\u043a"}'
+    if backend not in AUTO_JSON_BACKENDS:
+        assert get_json_backend("auto") is not JSON_BACKENDS[backend]
+        pytest.xfail(f"{backend} не декодирует escape-последовательности")
+    assert get_json_backend(backend)(json_str) == json.loads(json_str)
+    process_json(json_str, ["key1", "key2"], ["жук", "value1"], backend=backend)
+    assert capsys.readouterr().out.splitlines() == ["key1: жук", "key1: value1", "key2: жук"]
+
+
+def test_get_json_backend_auto_prefers_compatible(monkeypatch):
+    monkeypatch.delitem(JSON_BACKENDS, "orjson", raising=False)
+    monkeypatch.setitem(JSON_BACKENDS, "custom_json", Mock())
+    assert get_json_backend("auto") is JSON_BACKENDS["json"]
+
+
+def test_get_json_backend():
+    assert get_json_backend() is JSON_BACKENDS["json"]
+    assert get_json_backend("json") is JSON_BACKENDS["json"]
+    assert get_json_backend("auto") in JSON_BACKENDS.values()
+    with pytest.raises(ValueError, match="недоступен"):
+        get_json_backend("unknown")
+
+
+def test_process_json_parallel_documents():
+    documents = NDJSON.splitlines() * 50
+    counters = Counter()
+    result = process_json_parallel(
+        documents, ["key1", "key2"], ["value1", "value3"], workers=3, chunk_size=7, counters=counters
+    )
+    assert result == Counter({("key1", "value1"): 100, ("key1", "value3"): 50,
+                              ("key2", "value3"): 50, ("key2", "value1"): 50})
+    assert counters == Counter(processed=150, skipped=150, matches=250)
+
+
+def test_process_json_parallel_files(tmp_path):
+    paths = []
+    for i in range(4):
+        p = tmp_path / f"docs_{i}.ndjson"
+        p.write_text(NDJSON, encoding='utf-8')
+        paths.append(str(p))
+    result = process_json_parallel(paths, ["key1"], ["value1"], files=True, workers=2)
+    assert result == Counter({("key1", "value1"): 8})
+    sequential = Counter(match for path in paths for match in process_json_stream(path, ["key1"], ["value1"]))
+    assert result == sequential
+
+
+def test_process_json_parallel_empty_and_invalid():
+    assert process_json_parallel([], ["key1"], ["value1"], workers=1) == Counter()
+    with pytest.raises(ValueError):
+        process_json_parallel([], ["key1"], ["value1"], chunk_size=0)
+    with pytest.raises(ValueError, match="недоступен"):
+        process_json_parallel([], ["key1"], ["value1"], backend="unknown")
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    peak = 0
+
+    def __init__(self, max_workers=None):
+        super().__init__(max_workers)
+        self.in_flight = 0
+        self.lock = threading.Lock()
+
+    def submit(self, fn, /, *args, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            CountingExecutor.peak = max(CountingExecutor.peak, self.in_flight)
+        future = super().submit(fn, *args, **kwargs)
+        future.add_done_callback(self.done)
+        return future
+
+    def done(self, future):
+        with self.lock:
+            self.in_flight -= 1
+
+
+def test_process_json_parallel_bounded_window(monkeypatch):
+    count_matches = process_json_module._count_matches  # pylint: disable=protected-access
+    pulled = []
+
+    def slow_count_matches(*args):
+        time.sleep(0.005)
+        return count_matches(*args)
+
+    def documents():
+        for i in range(200):
+            pulled.append(i)
+            yield NDJSON.splitlines()[i % 2 * 4]
+
+    monkeypatch.setattr(process_json_module, "ProcessPoolExecutor", CountingExecutor)
+    monkeypatch.setattr(process_json_module, "_count_matches", slow_count_matches)
+    CountingExecutor.peak = 0
+    counters = Counter()
+    result = process_json_parallel(documents(), ["key1"], ["value1"], workers=2, chunk_size=5, counters=counters)
+    assert len(pulled) == 200
+    assert 0 < CountingExecutor.peak <= 4
+    assert result == Counter({("key1", "value1"): 200})
+    assert counters == Counter(processed=200, matches=200)
+
+
+@pytest.mark.asyncio
+async def test_process_json_unknown_backend(capsys):
+    with pytest.raises(ValueError, match="недоступен"):
+        process_json('{"key1": "value1"}', ["key1"], ["value1"], backend="unknown")
+    with pytest.raises(ValueError, match="недоступен"):
+        await process_json_async('{"key1": "value1"}', ["key1"], ["value1"], backend="unknown")
+    assert capsys.readouterr().out == ""
+
+
+def test_process_json_parallel_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        process_json_parallel([str(tmp_path / "missing.ndjson")], ["key1"], ["value1"], files=True, workers=1)
+
+
+def test_process_json_batch_callback(capsys):
+    batch_callback = Mock(return_value="batch_output")
+    json_str = '{"key1": "value1 value2", "key2": "value1"}'
+    process_json(json_str, required_keys=["key1", "key2"], tokens=["value1", "value2"], batch_callback=batch_callback)
+    batch_callback.assert_called_once_with([("key1", "value1"), ("key1", "value2"), ("key2", "value1")])
+    assert capsys.readouterr().out.strip() == "batch_output"
+
+
+def test_process_json_batch_callback_not_called_without_matches(capsys):
+    batch_callback = Mock()
+    process_json('{"key1": "value1"}', required_keys=["key1"], tokens=["other"], batch_callback=batch_callback)
+    process_json("{invalid}", required_keys=["key1"], tokens=["value1"], batch_callback=batch_callback)
+    batch_callback.assert_not_called()
+    assert "Ошибка: Ошибка декодирования JSON" in capsys.readouterr().out
+
+
+@pytest.mark.asyncio
+async def test_process_json_async_callbacks_run_concurrently(capsys):
+    running = []
+    peak = []
+
+    async def callback(key, token):
+        running.append(token)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(token)
+        return f"{key}={token}"
+
+    json_str = '{"key1": "value1 value2 value3"}'
+    await process_json_async(json_str, ["key1"], ["value3", "value1", "value2"], callback=callback)
+    assert max(peak) == 3
+    assert capsys.readouterr().out.splitlines() == ["key1=value3", "key1=value1", "key1=value2"]
+
+
+@pytest.mark.asyncio
+async def test_process_json_async_sync_and_batch_callbacks(capsys):
+    json_str = '{"key1": "value1 value2"}'
+    await process_json_async(json_str, ["key1"], ["value1"])
+    await process_json_async(json_str, ["key1"], ["value1"], callback=lambda key, token: f"sync {key}")
+    batch_callback = AsyncMock(return_value="async batch")
+    await process_json_async(json_str, ["key1"], ["value1", "value2"], batch_callback=batch_callback)
+    await process_json_async("{invalid}", ["key1"], ["value1"], batch_callback=batch_callback)
+    batch_callback.assert_awaited_once_with([("key1", "value1"), ("key1", "value2")])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[:3] == ["key1: value1", "sync key1", "async batch"]
+    assert lines[3].startswith("Ошибка: Ошибка декодирования JSON")
+
+
+@pytest.mark.asyncio
+async def test_dispatch_matches_batches_stream():
+    batches = []
+    counters = Counter()
+    matches = process_json_stream(NDJSON.splitlines() * 5, ["key1"], ["value1", "value3"], counters=counters)
+    count = await dispatch_matches(matches, batches.append, batch_size=4)
+    assert count == 4
+    assert [len(batch) for batch in batches] == [4, 4, 4, 3]
+    assert counters["matches"] == 15
+
+
+@pytest.mark.asyncio
+async def test_dispatch_matches_bounded_concurrency():
+    running = []
+    peak = []
+
+    async def batch_callback(batch):
+        running.append(batch)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(batch)
+
+    matches = [("key", f"token{i}") for i in range(20)]
+    assert await dispatch_matches(matches, batch_callback, batch_size=2, concurrency=3) == 10
+    assert max(peak) == 3
+
+
+@pytest.mark.asyncio
+async def test_dispatch_matches_errors():
+    async def failing(batch):
+        raise RuntimeError("storage down")
+
+    with pytest.raises(RuntimeError, match="storage down"):
+        await dispatch_matches([("key", "token")], failing)
+    with pytest.raises(ValueError):
+        await dispatch_matches([], failing, batch_size=0)
+    assert await dispatch_matches([], failing) == 0
@@ -0,0 +1,182 @@
+# pylint: disable=import-error
+import numbers
+import operator
+from array import array
+from itertools import zip_longest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+OVERFLOW_MESSAGE = "Значения выходят за пределы int64"
+
+
+def _check_int64(values):
+    if any(isinstance(v, int) and not INT64_MIN <= v <= INT64_MAX for v in values):
+        raise OverflowError(OVERFLOW_MESSAGE)
+
+
+def _int_bounds(value):
+    if np.ndim(value) == 0:
+        return int(value), int(value)
+    if len(value) == 0:
+        return 0, 0
+    return min(int(value.min()), 0), max(int(value.max()), 0)
+
+
+def _fits_int64(left, right, ufunc):
+    if any(np.ndim(v) != 0 and v.dtype.kind not in 'iu' or np.ndim(v) == 0 and not isinstance(v, int)
+           for v in (left, right)):
+        return True
+    (left_min, left_max), (right_min, right_max) = _int_bounds(left), _int_bounds(right)
+    if ufunc is np.add:
+        low, high = left_min + right_min, left_max + right_max
+    else:
+        low, high = left_min - right_max, left_max - right_min
+    return INT64_MIN <= low and high <= INT64_MAX
+
+
+def _combine_numpy(left, right, ufunc):
+    if not _fits_int64(left, right, ufunc):
+        # Границы не гарантируют отсутствие переполнения: считаем точно
+        # на целых Python и возвращаемся к int64, если результат помещается.
+        result = _combine_numpy(np.asarray(left, dtype=object), np.asarray(right, dtype=object), ufunc)
+        _check_int64(result)
+        return result.astype(np.int64)
+    if np.ndim(left) == 0 or np.ndim(right) == 0 or len(left) == len(right):
+        return ufunc(left, right)
+    result = np.zeros(max(len(left), len(right)), dtype=np.result_type(left, right))
+    result[:len(left)] = left
+    ufunc(result[:len(right)], right, out=result[:len(right)])
+    return result
+
+
+def _combine_array(left, right, func):
+    if isinstance(right, array):
+        values = [func(v1, v2) for v1, v2 in zip_longest(left, right, fillvalue=0)]
+    else:
+        values = [func(v, right) for v in left]
+    _check_int64(values)
+    return array('q' if all(isinstance(v, int) for v in values) else 'd', values)
+
+
+class ArrayCustomList:
+    __slots__ = ('data',)
+    __array_ufunc__ = None
+
+    def __init__(self, values=()):
+        if isinstance(values, ArrayCustomList):
+            values = values.data
+        if np is not None:
+            data = np.array(values)
+            if data.dtype.kind in 'fuO' and not isinstance(values, np.ndarray):
+                _check_int64(values if isinstance(values, (list, tuple)) else data.tolist())
+            if data.dtype.kind == 'u' and data.size and int(data.max()) > INT64_MAX:
+                raise OverflowError(OVERFLOW_MESSAGE)
+            if data.size == 0 or data.dtype.kind in 'bu':
+                data = data.astype(np.int64)
+            if data.ndim != 1 or data.dtype.kind not in 'iuf':
+                raise TypeError("ArrayCustomList поддерживает только одномерные числовые данные")
+        else:
+            values = list(values)
+            if not all(isinstance(v, (int, float)) for v in values):
+                raise TypeError("ArrayCustomList поддерживает только одномерные числовые данные")
+            _check_int64(values)
+            data = array('q' if all(isinstance(v, int) for v in values) else 'd', values)
+        self.data = data
+
+    @classmethod
+    def _wrap(cls, data):
+        result = cls.__new__(cls)
+        result.data = data
+        return result
+
+    def _coerce(self, other):
+        if isinstance(other, numbers.Real):
+            return int(other) if isinstance(other, numbers.Integral) else float(other)
+        if isinstance(other, ArrayCustomList):
+            other = other.data
+        elif not isinstance(other, (list, tuple, array)) and not (np is not None and isinstance(other, np.ndarray)):
+            return None
+        if isinstance(self.data, array) and isinstance(other, array):
+            return other
+        return ArrayCustomList(other).data
+
+    def __process_operation(self, other, ufunc, func, r_op=False):
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        if isinstance(self.data, array):
+            if r_op:
+                return self._wrap(_combine_array(self.data, other, lambda v1, v2: func(v2, v1)))
+            return self._wrap(_combine_array(self.data, other, func))
+        if r_op:
+            return self._wrap(_combine_numpy(other, self.data, ufunc))
+        return self._wrap(_combine_numpy(self.data, other, ufunc))
+
+    def __add__(self, other):
+        return self.__process_operation(other, np and np.add, operator.add)
+
+    def __radd__(self, other):
+        return self.__process_operation(other, np and np.add, operator.add, r_op=True)
+
+    def __sub__(self, other):
+        return self.__process_operation(other, np and np.subtract, operator.sub)
+
+    def __rsub__(self, other):
+        return self.__process_operation(other, np and np.subtract, operator.sub, r_op=True)
+
+    def sum(self):
+        if isinstance(self.data, array):
+            return sum(self.data)
+        if self.data.dtype.kind in 'iu':
+            low, high = _int_bounds(self.data)
+            if max(-low, high) * len(self.data) > INT64_MAX:
+                return sum(self.data.tolist())
+        return self.data.sum().item()
+
+    @staticmethod
+    def _total(other):
+        return other.sum() if isinstance(other, ArrayCustomList) else sum(other)
+
+    def __eq__(self, other):
+        return self.sum() == self._total(other)
+
+    def __ne__(self, other):
+        return self.sum() != self._total(other)
+
+    def __lt__(self, other):
+        return self.sum() < self._total(other)
+
+    def __le__(self, other):
+        return self.sum() <= self._total(other)
+
+    def __gt__(self, other):
+        return self.sum() > self._total(other)
+
+    def __ge__(self, other):
+        return self.sum() >= self._total(other)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._wrap(self.data[index])
+        value = self.data[index]
+        return value if isinstance(self.data, array) else value.item()
+
+    def tolist(self):
+        return self.data.tolist()
+
+    def __repr__(self):
+        return f"ArrayCustomList({self.tolist()})"
+
+    def __str__(self):
+        return f"{' '.join(map(str, self.tolist()))} Сумма: {self.sum()}"
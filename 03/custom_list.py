@@ -1,55 +1,307 @@
-from itertools import zip_longest
+import operator
+from decimal import Decimal
+from itertools import chain, islice, repeat, starmap, zip_longest
+
+SCALAR_TYPES = (int, float, Decimal)
 
 
 class CustomList(list):
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self.__total = None
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    def __update_total(self, added=(), removed=()):
+        # Инкрементально обновляем только точную целочисленную сумму,
+        # иначе погрешность float накапливается; пересчёт откладываем.
+        if isinstance(self.__total, int) and all(isinstance(v, int) for v in chain(added, removed)):
+            self.__total += sum(added) - sum(removed)
+        else:
+            self.__total = None
+
+    def __get_total(self):
+        if self.__total is None:
+            self.__total = sum(self)
+        return self.__total
+
+    def append(self, value):
+        super().append(value)
+        self.__update_total(added=(value,))
+
+    def extend(self, iterable):
+        values = list(iterable)
+        super().extend(values)
+        self.__update_total(added=values)
+
+    def insert(self, index, value):
+        super().insert(index, value)
+        self.__update_total(added=(value,))
+
+    def pop(self, index=-1):
+        value = super().pop(index)
+        self.__update_total(removed=(value,))
+        return value
+
+    def remove(self, value):
+        index = self.index(value)
+        self.__update_total(removed=(self[index],))
+        super().__delitem__(index)
+
+    def clear(self):
+        super().clear()
+        self.__total = 0
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            removed = self[index]
+            super().__setitem__(index, value)
+            self.__update_total(added=value, removed=removed)
+        else:
+            removed = self[index]
+            super().__setitem__(index, value)
+            self.__update_total(added=(value,), removed=(removed,))
+
+    def __delitem__(self, index):
+        removed = self[index] if isinstance(index, slice) else (self[index],)
+        super().__delitem__(index)
+        self.__update_total(removed=removed)
+
+    @staticmethod
+    def __sum(other):
+        return other.__get_total() if isinstance(other, CustomList) else sum(other)  # pylint: disable=protected-access
+
+    def __process_operation(self, other, func, r_op=False):
+        if isinstance(other, SCALAR_TYPES):
+            pairs = zip(repeat(other), self) if r_op else zip(self, repeat(other))
+        elif isinstance(other, list):
+            pairs = zip_longest(other, self, fillvalue=0) if r_op else zip_longest(self, other, fillvalue=0)
+        else:
+            return NotImplemented
+        return CustomList(starmap(func, pairs))
+
+    def __process_inplace(self, other, func):
+        if isinstance(other, SCALAR_TYPES):
+            values = repeat(other)
+        elif isinstance(other, list):
+            values = chain(other, repeat(0))
+        else:
+            return NotImplemented
+        length = len(self)
+        try:
+            for index, value in zip(range(length), values):
+                super().__setitem__(index, func(self[index], value))
+            if isinstance(other, list) and len(other) > length:
+                super().extend(func(0, value) for value in islice(other, length, None))
+        finally:
+            self.__total = None
+        return self
+
+    def __add__(self, other):
+        return self.__process_operation(other, operator.add)
+
+    def __radd__(self, other):
+        return self.__process_operation(other, operator.add, r_op=True)
+
+    def __iadd__(self, other):
+        return self.__process_inplace(other, operator.add)
+
+    def __sub__(self, other):
+        return self.__process_operation(other, operator.sub)
+
+    def __rsub__(self, other):
+        return self.__process_operation(other, operator.sub, r_op=True)
+
+    def __isub__(self, other):
+        return self.__process_inplace(other, operator.sub)
+
+    def __mul__(self, other):
+        return self.__process_operation(other, operator.mul)
+
+    def __rmul__(self, other):
+        return self.__process_operation(other, operator.mul, r_op=True)
+
+    def __imul__(self, other):
+        return self.__process_inplace(other, operator.mul)
+
+    def __truediv__(self, other):
+        return self.__process_operation(other, operator.truediv)
+
+    def __rtruediv__(self, other):
+        return self.__process_operation(other, operator.truediv, r_op=True)
+
+    def __itruediv__(self, other):
+        return self.__process_inplace(other, operator.truediv)
+
+    def __floordiv__(self, other):
+        return self.__process_operation(other, operator.floordiv)
+
+    def __rfloordiv__(self, other):
+        return self.__process_operation(other, operator.floordiv, r_op=True)
+
+    def __ifloordiv__(self, other):
+        return self.__process_inplace(other, operator.floordiv)
+
+    def __mod__(self, other):
+        return self.__process_operation(other, operator.mod)
+
+    def __rmod__(self, other):
+        return self.__process_operation(other, operator.mod, r_op=True)
+
+    def __imod__(self, other):
+        return self.__process_inplace(other, operator.mod)
+
+    def __pow__(self, other):
+        return self.__process_operation(other, operator.pow)
+
+    def __rpow__(self, other):
+        return self.__process_operation(other, operator.pow, r_op=True)
+
+    def __ipow__(self, other):
+        return self.__process_inplace(other, operator.pow)
+
+    def __eq__(self, other):
+        return self.__get_total() == self.__sum(other)
+
+    def __ne__(self, other):
+        return self.__get_total() != self.__sum(other)
+
+    def __lt__(self, other):
+        return self.__get_total() < self.__sum(other)
+
+    def __le__(self, other):
+        return self.__get_total() <= self.__sum(other)
+
+    def __gt__(self, other):
+        return self.__get_total() > self.__sum(other)
+
+    def __ge__(self, other):
+        return self.__get_total() >= self.__sum(other)
+
+    def __str__(self):
+        return f"{' '.join(map(str, self))} Сумма: {self.__get_total()}"
+
+    def lazy(self):
+        return LazyCustomList(self)
+
+
+class LazyCustomList:
+    __slots__ = ('source', 'func', 'other', 'r_op', '_result')
+
+    def __init__(self, source, func=None, other=None, r_op=False):
+        self.source = source
+        self.func = func
+        self.other = other
+        self.r_op = r_op
+        self._result = None
 
     @staticmethod
-    def __calculate_values(val1, val2, op, r_op):
-        if op == '+':
-            return val1 + val2
-        return val2 - val1 if r_op else val1 - val2
+    def __operand(operand):
+        if isinstance(operand, LazyCustomList):
+            return operand.stream()
+        if isinstance(operand, list):
+            return chain(operand, repeat(0)), len(operand)
+        return repeat(operand), 0
 
-    def __process_operation(self, other, op='+', r_op=False):
-        if isinstance(other, int):
-            return CustomList([self.__calculate_values(v, other, op, r_op) for v in self])
+    def stream(self):
+        nodes = []
+        node = self
+        while isinstance(node, LazyCustomList) and node.func is not None:
+            nodes.append(node)
+            node = node.source
+        values, length = self.__operand(node.source if isinstance(node, LazyCustomList) else node)
+        for node in reversed(nodes):
+            other, other_length = self.__operand(node.other)
+            length = max(length, other_length)
+            pairs = (other, values) if node.r_op else (values, other)
+            values = chain(islice(map(node.func, *pairs), length), repeat(0))
+        return values, length
 
-        if isinstance(other, (list, CustomList)):
-            return CustomList([
-                self.__calculate_values(v1, v2, op, r_op)
-                for v1, v2 in zip_longest(self, other, fillvalue=0)
-            ])
+    def evaluate(self):
+        if self._result is None:
+            self._result = CustomList(self)
+        return self._result
 
-        return None
+    def __process_operation(self, other, func, r_op=False):
+        if not isinstance(other, (SCALAR_TYPES, list, LazyCustomList)):
+            return NotImplemented
+        return LazyCustomList(self, func, other, r_op)
 
     def __add__(self, other):
-        return self.__process_operation(other)
+        return self.__process_operation(other, operator.add)
 
     def __radd__(self, other):
-        return self.__process_operation(other, r_op=True)
+        return self.__process_operation(other, operator.add, r_op=True)
 
     def __sub__(self, other):
-        return self.__process_operation(other, op='-')
+        return self.__process_operation(other, operator.sub)
 
     def __rsub__(self, other):
-        return self.__process_operation(other, op='-', r_op=True)
+        return self.__process_operation(other, operator.sub, r_op=True)
+
+    def __mul__(self, other):
+        return self.__process_operation(other, operator.mul)
+
+    def __rmul__(self, other):
+        return self.__process_operation(other, operator.mul, r_op=True)
+
+    def __truediv__(self, other):
+        return self.__process_operation(other, operator.truediv)
+
+    def __rtruediv__(self, other):
+        return self.__process_operation(other, operator.truediv, r_op=True)
+
+    def __floordiv__(self, other):
+        return self.__process_operation(other, operator.floordiv)
+
+    def __rfloordiv__(self, other):
+        return self.__process_operation(other, operator.floordiv, r_op=True)
+
+    def __mod__(self, other):
+        return self.__process_operation(other, operator.mod)
+
+    def __rmod__(self, other):
+        return self.__process_operation(other, operator.mod, r_op=True)
+
+    def __pow__(self, other):
+        return self.__process_operation(other, operator.pow)
+
+    def __rpow__(self, other):
+        return self.__process_operation(other, operator.pow, r_op=True)
+
+    def __iter__(self):
+        if self._result is not None:
+            return iter(self._result)
+        values, length = self.stream()
+        return islice(values, length)
+
+    def __len__(self):
+        if self._result is not None:
+            return len(self._result)
+        return self.stream()[1]
+
+    def __getitem__(self, index):
+        return self.evaluate()[index]
 
     def __eq__(self, other):
-        return sum(self) == sum(other)
+        return self.evaluate() == other
 
     def __ne__(self, other):
-        return sum(self) != sum(other)
+        return self.evaluate() != other
 
     def __lt__(self, other):
-        return sum(self) < sum(other)
+        return self.evaluate() < other
 
     def __le__(self, other):
-        return sum(self) <= sum(other)
+        return self.evaluate() <= other
 
     def __gt__(self, other):
-        return sum(self) > sum(other)
+        return self.evaluate() > other
 
     def __ge__(self, other):
-        return sum(self) >= sum(other)
+        return self.evaluate() >= other
 
     def __str__(self):
-        return f"{' '.join(map(str, self))} Сумма: {sum(self)}"
+        return str(self.evaluate())
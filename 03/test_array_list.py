@@ -0,0 +1,188 @@
+from array import array
+
+import pytest
+
+import array_list
+from array_list import ArrayCustomList
+from custom_list import CustomList
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "array"])
+def use_numpy(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(array_list, "np", None)
+    elif array_list.np is None:
+        pytest.skip("numpy не установлен")
+    return request.param
+
+
+class TestArrayCustomList:
+    @pytest.mark.parametrize(
+        "list1, list2, expected",
+        [
+            ([1, 2, 3], 2, [3, 4, 5]),
+            ([1, 2, 3], 0.5, [1.5, 2.5, 3.5]),
+            ([1, 2, 3], [4, 5, 6], [5, 7, 9]),
+            ([1, 2, 3], [4, 5], [5, 7, 3]),
+            ([1, 2], [4, 5, 6], [5, 7, 6]),
+            ([1, 2, 3], [], [1, 2, 3]),
+            ([], [1, 2, 3], [1, 2, 3]),
+            ([1, 2, 3], (4, 5, 6), [5, 7, 9]),
+            ([1, 2], [0.5, 0.5, 0.5], [1.5, 2.5, 0.5]),
+        ],
+    )
+    def test_add(self, use_numpy, list1, list2, expected):
+        acl1 = ArrayCustomList(list1)
+        for other in (list2, ArrayCustomList(list2) if isinstance(list2, (list, tuple)) else list2):
+            result = acl1 + other
+            assert isinstance(result, ArrayCustomList)
+            assert result.tolist() == expected
+            assert (other + acl1).tolist() == expected
+        assert acl1.tolist() == list1
+        assert result.sum() == sum(expected)
+
+    @pytest.mark.parametrize(
+        "list1, list2, expected",
+        [
+            ([1, 2, 3], 2, [-1, 0, 1]),
+            ([1, 2, 3], [4, 5, 6], [-3, -3, -3]),
+            ([1, 2, 3], [4, 5], [-3, -3, 3]),
+            ([1, 2], [4, 5, 6], [-3, -3, -6]),
+            ([1, 2, 3], [], [1, 2, 3]),
+            ([], [1, 2, 3], [-1, -2, -3]),
+            ([2, 5, 9], [4], [-2, 5, 9]),
+        ],
+    )
+    def test_sub(self, use_numpy, list1, list2, expected):
+        acl1 = ArrayCustomList(list1)
+        acl2 = ArrayCustomList(list2) if isinstance(list2, list) else list2
+        assert (acl1 - list2).tolist() == expected
+        assert (acl1 - acl2).tolist() == expected
+        assert (list2 - acl1).tolist() == [-value for value in expected]
+        assert (acl2 - acl1).tolist() == [-value for value in expected]
+        assert acl1.tolist() == list1
+
+    def test_matches_custom_list(self, use_numpy):
+        values1 = list(range(-50, 50, 3))
+        values2 = [value * 7 % 11 for value in range(20)]
+        assert (ArrayCustomList(values1) + values2).tolist() == list(CustomList(values1) + values2)
+        assert (values2 - ArrayCustomList(values1)).tolist() == list(values2 - CustomList(values1))
+        assert str(ArrayCustomList(values1)) == str(CustomList(values1))
+
+    def test_array_operand(self, use_numpy):
+        acl = ArrayCustomList([1, 2])
+        assert (acl + array('q', [1])).tolist() == [2, 2]
+        assert (array('q', [1, 1, 1]) - acl).tolist() == [0, -1, 1]
+        assert (acl + array('d', [0.5])).tolist() == [1.5, 2]
+        with pytest.raises(OverflowError):
+            acl + array('Q', [2 ** 64 - 1])  # pylint: disable=expression-not-assigned
+
+    def test_invalid_operand(self, use_numpy):
+        acl = ArrayCustomList([1, 2, 3])
+        with pytest.raises(TypeError):
+            acl + "string"  # pylint: disable=pointless-statement
+        with pytest.raises(TypeError):
+            None - acl  # pylint: disable=pointless-statement
+        with pytest.raises(TypeError):
+            ArrayCustomList(["a", "b"])
+
+    @pytest.mark.parametrize(
+        "list1, list2, eq, lt",
+        [
+            ([1, 2, 3], [3, 2, 1], True, False),
+            ([1, 2, 3], [6], True, False),
+            ([1, 2, 3], [1, 2, 4], False, True),
+            ([1, 2, 3], [1, 2], False, False),
+            ([], [], True, False),
+            ([5, -5], [], True, False),
+            ([], [1], False, True),
+        ],
+    )
+    def test_comparisons(self, use_numpy, list1, list2, eq, lt):
+        acl1 = ArrayCustomList(list1)
+        for other in (list2, ArrayCustomList(list2), CustomList(list2)):
+            assert (acl1 == other) is eq
+            assert (acl1 != other) is not eq
+            assert (acl1 < other) is lt
+            assert (acl1 <= other) is (lt or eq)
+            assert (acl1 > other) is not (lt or eq)
+            assert (acl1 >= other) is not lt
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            lambda: ArrayCustomList([2 ** 62]) + [2 ** 62],
+            lambda: ArrayCustomList([2 ** 62]) - (-2 ** 62),
+            lambda: -2 ** 62 - ArrayCustomList([2 ** 62 + 1, 0]),
+            lambda: ArrayCustomList([1]) + 2 ** 70,
+            lambda: ArrayCustomList([2 ** 63]),
+            lambda: ArrayCustomList([-1, 2 ** 63]),
+            lambda: ArrayCustomList([1]) + [-(2 ** 64)],
+        ],
+    )
+    def test_int64_overflow(self, use_numpy, operation):
+        with pytest.raises(OverflowError):
+            operation()
+
+    def test_int64_bounds(self, use_numpy):
+        values1 = [2 ** 62, 0, -(2 ** 63)]
+        values2 = [0, 2 ** 62, 2 ** 63 - 1]
+        result = ArrayCustomList(values1) + values2
+        expected = CustomList(values1) + values2
+        assert result.tolist() == list(expected)
+        assert result == expected
+        big = ArrayCustomList([2 ** 62, 2 ** 62, 2 ** 62])
+        assert big.sum() == 3 * 2 ** 62
+        assert big == CustomList([2 ** 62] * 3)
+        assert str(big) == str(CustomList([2 ** 62] * 3))
+
+    def test_sequence_protocol(self, use_numpy):
+        acl = ArrayCustomList([1, 2, 3, 4])
+        assert len(acl) == 4
+        assert list(acl) == [1, 2, 3, 4]
+        assert acl[1] == 2 and isinstance(acl[1], int)
+        assert acl[-1] == 4
+        assert isinstance(acl[1:3], ArrayCustomList)
+        assert acl[1:3].tolist() == [2, 3]
+        assert repr(acl) == "ArrayCustomList([1, 2, 3, 4])"
+        assert ArrayCustomList(acl).tolist() == [1, 2, 3, 4]
+
+    def test_str(self, use_numpy):
+        assert str(ArrayCustomList([1, 2, 3])) == "1 2 3 Сумма: 6"
+        assert str(ArrayCustomList([])) == " Сумма: 0"
+        assert str(ArrayCustomList([1.5, 2])) == "1.5 2.0 Сумма: 3.5"
+
+    def test_backend(self, use_numpy):
+        acl = ArrayCustomList([1, 2, 3]) + [1]
+        if use_numpy:
+            assert isinstance(acl.data, array_list.np.ndarray)
+        else:
+            assert isinstance(acl.data, array)
+            assert acl.data.typecode == 'q'
+            assert (acl + 0.5).data.typecode == 'd'
+
+    def test_numpy_operand_defers(self):
+        np = pytest.importorskip("numpy")
+        acl = ArrayCustomList([1, 2, 3])
+        result = np.array([1, 1]) + acl
+        assert isinstance(result, ArrayCustomList)
+        assert result.tolist() == [2, 3, 3]
+        assert (acl - np.array([1, 1, 1, 1])).tolist() == [0, 1, 2, -1]
+
+    def test_numpy_scalar_operands(self):
+        np = pytest.importorskip("numpy")
+        acl = ArrayCustomList([1, 2])
+        for scalar in (np.int64(2), np.int8(2), np.uint32(2), np.float32(2.0)):
+            assert (acl + scalar).tolist() == [3, 4]
+            assert (scalar - acl).tolist() == [1, 0]
+        assert isinstance((acl + np.int64(2))[0], int)
+
+    def test_numpy_array_input_range(self):
+        np = pytest.importorskip("numpy")
+        with pytest.raises(OverflowError):
+            ArrayCustomList(np.array([2 ** 64 - 1], dtype=np.uint64))
+        acl = ArrayCustomList(np.array([2 ** 63 - 1, 1], dtype=np.uint64))
+        assert acl.data.dtype == np.int64
+        assert (acl - [1]).tolist() == [2 ** 63 - 2, 1]
+        with pytest.raises(OverflowError):
+            ArrayCustomList([1]) + np.array([2 ** 64 - 1], dtype=np.uint64)  # pylint: disable=expression-not-assigned
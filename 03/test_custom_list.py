@@ -1,5 +1,11 @@
+import copy
+import operator
+import pickle
+import random
+from decimal import Decimal
+
 import pytest
-from custom_list import CustomList
+from custom_list import CustomList, LazyCustomList
 
 
 class TestCustomList:
@@ -57,8 +63,11 @@ class TestCustomList:
 
     def test_add_invalid_type(self):
         cl = CustomList([1, 2, 3])
-        result = cl + "string"
-        assert result is None
+        with pytest.raises(TypeError):
+            cl + "string"  # pylint: disable=pointless-statement
+        with pytest.raises(TypeError):
+            None - cl  # pylint: disable=pointless-statement
+        assert cl.__add__("string") is NotImplemented  # pylint: disable=unnecessary-dunder-call
 
     @pytest.mark.parametrize(
         "list1, list2, expected",
@@ -307,3 +316,239 @@ class TestCustomList:
         assert (cl <= [1, 2, 3]) is True
         assert (cl > [1, 2, 2]) is True
         assert (cl >= [1, 2, 3]) is True
+
+    @pytest.mark.parametrize(
+        "mutation",
+        [
+            lambda cl: cl.append(5),
+            lambda cl: cl.extend(iter([4, 5])),
+            lambda cl: cl.insert(1, 7),
+            lambda cl: cl.pop(),
+            lambda cl: cl.pop(0),
+            lambda cl: cl.remove(2),
+            lambda cl: cl.clear(),
+            lambda cl: cl.__setitem__(1, 10),
+            lambda cl: cl.__setitem__(slice(1, 3), iter([7, 8, 9])),
+            lambda cl: cl.__setitem__(slice(None, None, 2), [0, 0]),
+            lambda cl: cl.__delitem__(0),
+            lambda cl: cl.__delitem__(slice(1, None)),
+            lambda cl: cl.__iadd__([1, 1]),
+            lambda cl: cl.__imul__(3),
+            lambda cl: cl.__imul__(0),
+            lambda cl: cl.sort(reverse=True),
+        ],
+    )
+    def test_cached_sum_follows_mutations(self, mutation):
+        cl = CustomList([1, 2, 3])
+        mutation(cl)
+        assert str(cl) == f"{' '.join(map(str, cl))} Сумма: {sum(list(cl))}"
+        assert cl == CustomList(list(cl))
+        assert cl == [sum(list(cl))]
+
+    def test_cached_sum_float_no_drift(self):
+        cl = CustomList([1e16, 1.0])
+        assert cl.pop(0) == 1e16
+        assert str(cl) == "1.0 Сумма: 1.0"
+        assert cl == [1.0]
+
+        cl = CustomList([0.1] * 10)
+        assert str(cl).endswith("Сумма: 0.9999999999999999")
+        while cl:
+            cl.pop()
+        assert cl == CustomList()
+        assert str(cl) == " Сумма: 0"
+
+        cl = CustomList([1, 2])
+        cl.append(0.5)
+        cl[0] = 1e16
+        del cl[0]
+        assert str(cl) == "2 0.5 Сумма: 2.5"
+
+    def test_cached_sum_non_numeric(self):
+        cl = CustomList(["a", "b"])
+        assert list(cl) == ["a", "b"]
+        cl.append("c")
+        with pytest.raises(TypeError):
+            str(cl)
+
+    def test_cached_sum_failed_mutation(self):
+        cl = CustomList([1, 2, 3])
+        with pytest.raises(IndexError):
+            cl[5] = 1
+        with pytest.raises(ValueError):
+            cl.remove(10)
+        with pytest.raises(ValueError):
+            cl[::2] = [1]
+        assert str(cl) == "1 2 3 Сумма: 6"
+
+    def test_cached_sum_copy(self):
+        cl = CustomList([1, 2, 3])
+        for clone in (copy.copy(cl), copy.deepcopy(cl), pickle.loads(pickle.dumps(cl))):
+            assert isinstance(clone, CustomList)
+            assert str(clone) == "1 2 3 Сумма: 6"
+
+    @pytest.mark.parametrize(
+        "list1, list2, expected_add, expected_sub",
+        [
+            ([1, 2, 3], 2, [3, 4, 5], [-1, 0, 1]),
+            ([1, 2, 3], [4, 5, 6], [5, 7, 9], [-3, -3, -3]),
+            ([1, 2, 3], CustomList([4, 5]), [5, 7, 3], [-3, -3, 3]),
+            ([1, 2], [4, 5, 6], [5, 7, 6], [-3, -3, -6]),
+            ([1, 2, 3], [], [1, 2, 3], [1, 2, 3]),
+            ([], CustomList([1, 2, 3]), [1, 2, 3], [-1, -2, -3]),
+        ],
+    )
+    def test_inplace(self, list1, list2, expected_add, expected_sub):
+        for operation, expected in (("__iadd__", expected_add), ("__isub__", expected_sub)):
+            cl = CustomList(list1)
+            other = list2.copy() if isinstance(list2, list) else list2
+            result = getattr(cl, operation)(other)
+            assert result is cl
+            assert list(cl) == expected
+            assert str(cl) == f"{' '.join(map(str, expected))} Сумма: {sum(expected)}"
+            assert other == list2 if isinstance(list2, int) else list(other) == list(list2)
+
+    def test_inplace_operators(self):
+        cl = CustomList([1, 2])
+        original = cl
+        cl += [1, 1, 1]
+        cl -= 1
+        assert cl is original
+        assert list(cl) == [1, 2, 0]
+        cl += cl
+        assert list(cl) == [2, 4, 0]
+        cl -= cl
+        assert list(cl) == [0, 0, 0]
+        assert str(cl) == "0 0 0 Сумма: 0"
+
+    def test_inplace_invalid_type(self):
+        cl = CustomList([1, 2, 3])
+        original = cl
+        with pytest.raises(TypeError):
+            cl += "string"
+        assert cl is original
+        assert str(cl) == "1 2 3 Сумма: 6"
+
+    @pytest.mark.parametrize(
+        "operation, list1, other, expected",
+        [
+            (operator.mul, [1, 2, 3], 2, [2, 4, 6]),
+            (operator.mul, [1, 2, 3], [4, 5], [4, 10, 0]),
+            (operator.mul, [1, 2], CustomList([4, 5, 6]), [4, 10, 0]),
+            (operator.truediv, [1, 2, 3], 2, [0.5, 1.0, 1.5]),
+            (operator.truediv, [1, 2], [4, 5, 6], [0.25, 0.4, 0.0]),
+            (operator.floordiv, [7, 8, 9], 2, [3, 4, 4]),
+            (operator.floordiv, [7, 8], [2, 3, 4], [3, 2, 0]),
+            (operator.mod, [7, 8, 9], 4, [3, 0, 1]),
+            (operator.mod, [7, 8], [2, 3, 4], [1, 2, 0]),
+            (operator.pow, [1, 2, 3], 2, [1, 4, 9]),
+            (operator.pow, [1, 2, 3], [3, 2], [1, 4, 1]),
+            (operator.add, [1, 2, 3], 0.5, [1.5, 2.5, 3.5]),
+            (operator.sub, [1.5, 2.5], 0.5, [1.0, 2.0]),
+            (operator.mul, [Decimal("1.1"), Decimal("2.2")], Decimal("2"), [Decimal("2.2"), Decimal("4.4")]),
+            (operator.add, [1, 2], Decimal("0.1"), [Decimal("1.1"), Decimal("2.1")]),
+        ],
+    )
+    def test_operator_engine(self, operation, list1, other, expected):
+        cl = CustomList(list1)
+        result = self.check_original_unchanged(cl, other, lambda: operation(cl, other))
+        assert isinstance(result, CustomList)
+        assert list(result) == expected
+        assert str(result) == f"{' '.join(map(str, expected))} Сумма: {sum(expected)}"
+
+        inplace = getattr(operator, f"i{operation.__name__}")
+        original = cl
+        cl = inplace(cl, other)
+        assert cl is original
+        assert list(cl) == expected
+        assert cl == result
+
+    @pytest.mark.parametrize(
+        "operation, other, list1, expected",
+        [
+            (operator.mul, 2, [1, 2, 3], [2, 4, 6]),
+            (operator.mul, [4, 5, 6], [1, 2], [4, 10, 0]),
+            (operator.truediv, 6, [1, 2, 3], [6.0, 3.0, 2.0]),
+            (operator.floordiv, [7, 8], [2, 3], [3, 2]),
+            (operator.mod, 10, [3, 4], [1, 2]),
+            (operator.pow, 2, [1, 2, 3], [2, 4, 8]),
+            (operator.sub, Decimal("1"), [1, 2], [Decimal("0"), Decimal("-1")]),
+            (operator.sub, 0.5, [1, 2], [-0.5, -1.5]),
+        ],
+    )
+    def test_operator_engine_reflected(self, operation, other, list1, expected):
+        cl = CustomList(list1)
+        result = self.check_original_unchanged(cl, other, lambda: operation(other, cl))
+        assert isinstance(result, CustomList)
+        assert list(result) == expected
+
+    def test_operator_engine_zero_padding_division(self):
+        with pytest.raises(ZeroDivisionError):
+            CustomList([1, 2, 3]) / [1, 2]  # pylint: disable=expression-not-assigned
+        cl = CustomList([4, 6, 8])
+        with pytest.raises(ZeroDivisionError):
+            cl //= [2, 0]
+        assert list(cl) == [2, 6, 8]
+        assert str(cl) == "2 6 8 Сумма: 16"
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_lazy_matches_eager(self, seed):
+        rnd = random.Random(seed)
+        operations = [operator.add, operator.sub, operator.mul]
+        eager = CustomList(rnd.randint(-5, 5) for _ in range(rnd.randint(0, 6)))
+        lazy = eager.lazy()
+        for _ in range(10):
+            operation = rnd.choice(operations)
+            other = rnd.choice([
+                rnd.randint(-3, 3),
+                rnd.random(),
+                [rnd.randint(-5, 5) for _ in range(rnd.randint(0, 8))],
+                CustomList(rnd.randint(-5, 5) for _ in range(rnd.randint(0, 8))),
+            ])
+            if rnd.random() < 0.5:
+                eager, lazy = operation(eager, other), operation(lazy, other)
+            else:
+                eager, lazy = operation(other, eager), operation(other, lazy)
+            assert isinstance(lazy, LazyCustomList)
+        assert len(lazy) == len(eager)
+        assert list(lazy) == list(eager)
+        assert str(lazy) == str(eager)
+
+    def test_lazy_materialization(self):
+        cl1 = CustomList([1, 2])
+        cl2 = CustomList([1, 1, 1, 1])
+        expression = cl1.lazy() + [3, 4, 5] - cl2 + 5
+        assert len(expression) == 4
+        assert list(expression) == [8, 10, 9, 4]
+        assert expression[1] == 10
+        assert expression[1:3] == [10, 9]
+        result = expression.evaluate()
+        assert isinstance(result, CustomList)
+        assert expression.evaluate() is result
+        assert list(5 - (cl1.lazy() + 5) * cl2) == [-1, -2, 5, 5]
+        assert list(cl2 + (cl1.lazy() ** 2)) == [2, 5, 1, 1]
+        assert list(cl1.lazy() + cl2.lazy() / 2) == [1.5, 2.5, 0.5, 0.5]
+
+    def test_lazy_comparisons(self):
+        expression = CustomList([1, 2]).lazy() + [1, 1]
+        assert expression == [5]
+        assert expression != [4]
+        assert expression < [6] and expression <= [5]
+        assert expression > [4] and expression >= [5]
+        assert CustomList([5]) == expression
+
+    def test_lazy_is_deferred(self):
+        cl = CustomList([1, 2, 3])
+        expression = cl.lazy() / [1, 0]
+        cl[0] = 10
+        with pytest.raises(ZeroDivisionError):
+            list(expression)
+        assert list((cl.lazy() + [1]).evaluate()) == [11, 2, 3]
+        with pytest.raises(TypeError):
+            cl.lazy() + "string"  # pylint: disable=expression-not-assigned
+
+    def test_lazy_long_chain(self):
+        expression = CustomList([1, 2]).lazy()
+        for _ in range(5000):
+            expression = expression + 1
+        assert list(expression) == [5001, 5002]